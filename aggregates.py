@@ -0,0 +1,200 @@
+import heapq
+from datetime import date, datetime, timedelta
+from itertools import count
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+import homework
+
+Moment = Union[date, datetime]
+Key = Tuple[Hashable, str]
+BucketKey = Tuple[Hashable, str, date]
+
+
+def _day(moment: date) -> date:
+    return moment
+
+
+def _week(moment: date) -> date:
+    return moment - timedelta(days=moment.weekday())
+
+
+def _month(moment: date) -> date:
+    return moment.replace(day=1)
+
+
+def _shift_days(days: int) -> Callable[[date, int], date]:
+    def shift(bucket: date, count: int) -> date:
+        return bucket + timedelta(days=days * count)
+    return shift
+
+
+def _shift_months(bucket: date, count: int) -> date:
+    months = bucket.year * 12 + bucket.month - 1 + count
+    return date(months // 12, months % 12 + 1, 1)
+
+
+GRANULARITIES: Dict[str, Tuple[Callable, Callable]] = {
+    'day': (_day, _shift_days(1)),
+    'week': (_week, _shift_days(7)),
+    'month': (_month, _shift_months),
+}
+
+
+class Totals:
+    """Суммы по набору тренировок."""
+    __slots__ = ('count', 'duration', 'distance', 'speed', 'calories')
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.distance = 0.0
+        self.speed = 0.0
+        self.calories = 0.0
+
+    def add(self, info: homework.InfoMessage, sign: int = 1) -> None:
+        """Добавить сообщение о тренировке или вычесть его при sign=-1."""
+
+        self.count += sign
+        self.duration += sign * info.duration
+        self.distance += sign * info.distance
+        self.speed += sign * info.speed
+        self.calories += sign * info.calories
+
+    def merge(self, other: 'Totals', sign: int = 1) -> None:
+        """Прибавить или вычесть другие суммы."""
+
+        self.count += sign * other.count
+        self.duration += sign * other.duration
+        self.distance += sign * other.distance
+        self.speed += sign * other.speed
+        self.calories += sign * other.calories
+
+    @property
+    def mean_speed(self) -> float:
+        """Средняя скорость по тренировкам."""
+
+        return self.speed / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Вернуть суммы словарём."""
+
+        return {
+            'count': self.count,
+            'duration': self.duration,
+            'distance': self.distance,
+            'calories': self.calories,
+            'mean_speed': self.mean_speed,
+        }
+
+
+class Aggregates:
+    """Инкрементальные суммы по пользователю, виду тренировки и периоду.
+
+    Добавление и отмена тренировки стоят O(1). Если задано `retention`,
+    хранится только столько последних периодов; суммы по всему окну
+    поддерживаются сразу и читаются за O(1), а тренировки старше окна
+    после `expire()` не учитываются. Суммы с плавающей точкой
+    после отмен могут отличаться от пересчёта на ошибку округления.
+    """
+
+    def __init__(
+            self,
+            granularity: str = 'day',
+            retention: Optional[int] = None,
+    ) -> None:
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'Unknown granularity: {granularity}')
+        if retention is not None and retention < 1:
+            raise ValueError(f'Retention must be positive: {retention}')
+        self.granularity = granularity
+        self.retention = retention
+        self._bucket, self._shift = GRANULARITIES[granularity]
+        self._buckets: Dict[BucketKey, Totals] = {}
+        self._windows: Dict[Key, Totals] = {}
+        self._expiry: List[Tuple[date, int, BucketKey]] = []
+        self._sequence = count()
+        self._horizon: Optional[date] = None
+
+    def bucket(self, moment: Moment) -> date:
+        """Вернуть начало периода, в который попадает момент."""
+
+        if isinstance(moment, datetime):
+            moment = moment.date()
+        return self._bucket(moment)
+
+    def _update(
+            self,
+            user: Hashable,
+            workout: Union[homework.InfoMessage, homework.Training],
+            moment: Moment,
+            sign: int,
+    ) -> None:
+        if isinstance(workout, homework.Training):
+            workout = workout.show_training_info()
+        bucket = self.bucket(moment)
+        if self._horizon is not None and bucket < self._horizon:
+            return
+        key = (user, workout.training_type, bucket)
+        totals = self._buckets.get(key)
+        if totals is None:
+            totals = self._buckets[key] = Totals()
+            heapq.heappush(
+                self._expiry, (bucket, next(self._sequence), key)
+            )
+        totals.add(workout, sign)
+        window = self._windows.get(key[:2])
+        if window is None:
+            window = self._windows[key[:2]] = Totals()
+        window.add(workout, sign)
+
+    def add(
+            self,
+            user: Hashable,
+            workout: Union[homework.InfoMessage, homework.Training],
+            moment: Moment,
+    ) -> None:
+        """Учесть тренировку пользователя в момент `moment`."""
+
+        self._update(user, workout, moment, 1)
+
+    def retract(
+            self,
+            user: Hashable,
+            workout: Union[homework.InfoMessage, homework.Training],
+            moment: Moment,
+    ) -> None:
+        """Отменить ранее учтённую тренировку."""
+
+        self._update(user, workout, moment, -1)
+
+    def expire(self, now: Moment) -> int:
+        """Удалить периоды за пределами окна хранения, вернуть их число."""
+
+        if self.retention is None:
+            return 0
+        horizon = self._shift(self.bucket(now), 1 - self.retention)
+        if self._horizon is None or horizon > self._horizon:
+            self._horizon = horizon
+        expired = 0
+        while self._expiry and self._expiry[0][0] < self._horizon:
+            _, _, key = heapq.heappop(self._expiry)
+            totals = self._buckets.pop(key)
+            self._windows[key[:2]].merge(totals, -1)
+            expired += 1
+        return expired
+
+    def totals(
+            self,
+            user: Hashable,
+            training_type: str,
+            moment: Moment,
+    ) -> Totals:
+        """Вернуть суммы за период, в который попадает момент."""
+
+        key = (user, training_type, self.bucket(moment))
+        return self._buckets.get(key) or Totals()
+
+    def window(self, user: Hashable, training_type: str) -> Totals:
+        """Вернуть суммы за всё окно хранения."""
+
+        return self._windows.get((user, training_type)) or Totals()
@@ -0,0 +1,187 @@
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from homework import (TRAINING_FIELDS, TRAINING_TYPES, InfoMessage, Running,
+                      SportsWalking, Swimming)
+
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray]
+FIELDS: Tuple[str, ...] = (
+    'action', 'duration', 'weight', 'height', 'length_pool', 'count_pool',
+)
+DIVISOR_FIELDS: Tuple[str, ...] = ('duration', 'height')
+
+
+def _training_distance(training_class, action: np.ndarray) -> np.ndarray:
+    """Получить дистанцию в км для массива тренировок."""
+
+    return action * training_class.LEN_STEP / training_class.M_IN_KM
+
+
+def _running(
+        action: np.ndarray,
+        duration: np.ndarray,
+        weight: np.ndarray,
+        height: np.ndarray,
+        length_pool: np.ndarray,
+        count_pool: np.ndarray,
+) -> Columns:
+    """Посчитать дистанцию, скорость и калории для бега."""
+
+    distance = _training_distance(Running, action)
+    speed = distance / duration
+    basal_metabolic_rate = (
+        Running.CALORIES_HEIGHT_FACTOR
+        * speed
+        - Running.CALORIES_AGE_FACTOR
+    )
+    minutes = duration * Running.MINUTES_IN_HOUR
+    calories = (
+        basal_metabolic_rate
+        * weight
+        / Running.M_IN_KM * minutes
+    )
+    return distance, speed, calories
+
+
+def _sports_walking(
+        action: np.ndarray,
+        duration: np.ndarray,
+        weight: np.ndarray,
+        height: np.ndarray,
+        length_pool: np.ndarray,
+        count_pool: np.ndarray,
+) -> Columns:
+    """Посчитать дистанцию, скорость и калории для спортивной ходьбы."""
+
+    distance = _training_distance(SportsWalking, action)
+    speed = distance / duration
+    adjusted_weight = SportsWalking.ADJUSTED_FOR_MEN * weight
+    speed_square = speed**2
+    time = duration * SportsWalking.MINUTES_IN_HOUR
+    calories = (
+        (adjusted_weight + speed_square // height
+         * SportsWalking.SPORTSWALKING_EXERCISE_MODIFIER
+         * weight) * time
+    )
+    return distance, speed, calories
+
+
+def _swimming(
+        action: np.ndarray,
+        duration: np.ndarray,
+        weight: np.ndarray,
+        height: np.ndarray,
+        length_pool: np.ndarray,
+        count_pool: np.ndarray,
+) -> Columns:
+    """Посчитать дистанцию, скорость и калории для плавания."""
+
+    distance = _training_distance(Swimming, action)
+    speed = (
+        length_pool * count_pool
+        / Swimming.M_IN_KM / duration
+    )
+    calories = (
+        (speed + Swimming.EXERCISE_INTENSITY)
+        * Swimming.SWIMMING_EXERCISE_MODIFIER * weight
+    )
+    return distance, speed, calories
+
+
+BATCH_KERNELS: Dict[str, Callable[..., Columns]] = {
+    'SWM': _swimming,
+    'RUN': _running,
+    'WLK': _sports_walking,
+}
+
+
+def compute_batch(
+        workout_types: Sequence[str],
+        actions: Sequence[float],
+        durations: Sequence[float],
+        weights: Sequence[float],
+        heights: Sequence[float],
+        length_pools: Sequence[float],
+        count_pools: Sequence[float],
+) -> Columns:
+    """Посчитать дистанцию, скорость и калории для набора тренировок.
+
+    Колонки выровнены по индексу; поля, которые не нужны типу тренировки
+    (например, рост для плавания), могут содержать любое значение.
+    Результаты совпадают с методами классов тренировок до бита.
+    """
+
+    workout_types = np.asarray(workout_types)
+    columns = [
+        np.asarray(column, dtype=np.float64)
+        for column in (
+            actions, durations, weights, heights, length_pools, count_pools
+        )
+    ]
+    size = len(workout_types)
+    for column in columns:
+        if column.shape != (size,):
+            raise ValueError(
+                f'Column length {column.shape} does not match {size}'
+            )
+
+    distance = np.empty(size, dtype=np.float64)
+    speed = np.empty(size, dtype=np.float64)
+    calories = np.empty(size, dtype=np.float64)
+    for workout_type in np.unique(workout_types):
+        if workout_type not in BATCH_KERNELS:
+            raise ValueError(f'This key is not found: {workout_type}')
+        mask = workout_types == workout_type
+        with np.errstate(divide='ignore', invalid='ignore'):
+            results = BATCH_KERNELS[workout_type](
+                *(column[mask] for column in columns)
+            )
+        distance[mask], speed[mask], calories[mask] = results
+    return distance, speed, calories
+
+
+def compute_messages(
+        packages: Sequence[Tuple[str, Sequence[float]]],
+) -> List[InfoMessage]:
+    """Рассчитать сообщения для пакетов `(код, значения)` одним проходом.
+
+    Значения раскладываются по колонкам по именам параметров
+    конструктора класса тренировки, недостающие поля заполняются нулями.
+    Нулевые делители (DIVISOR_FIELDS) отклоняются ArithmeticError,
+    как в построчном расчёте, а не дают inf и nan; отрицательные
+    значения считаются по тем же формулам, что и построчно.
+    """
+
+    workout_types = []
+    names = []
+    columns: Dict[str, List[float]] = {name: [] for name in FIELDS}
+    for workout_type, data in packages:
+        if workout_type not in TRAINING_TYPES:
+            raise ValueError(f'This key is not found: {workout_type}')
+        fields = TRAINING_FIELDS[workout_type]
+        if len(data) != len(fields):
+            raise ValueError(
+                f'{workout_type} expects {len(fields)} values, '
+                f'got {len(data)}'
+            )
+        values = dict(zip(fields, data))
+        for name in DIVISOR_FIELDS:
+            if values.get(name) == 0:
+                raise ZeroDivisionError(
+                    f'{workout_type} {name} is zero'
+                )
+        for name, column in columns.items():
+            column.append(values.get(name, 0.0))
+        workout_types.append(workout_type)
+        names.append(TRAINING_TYPES[workout_type].__name__)
+    distance, speed, calories = compute_batch(
+        workout_types, *(columns[name] for name in FIELDS)
+    )
+    return [
+        InfoMessage(*message)
+        for message in zip(
+            names, columns['duration'], distance.tolist(), speed.tolist(),
+            calories.tolist(),
+        )
+    ]
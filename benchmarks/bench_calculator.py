@@ -0,0 +1,85 @@
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import homework
+from cache import PackageCache
+from calculator import Calculator
+from workload import Workload
+
+
+class GlobalLockCalculator:
+    """Один PackageCache под одной блокировкой — точка сравнения."""
+
+    def __init__(self) -> None:
+        self._cache = PackageCache()
+        self._lock = threading.Lock()
+
+    def message(self, workout_type, data):
+        with self._lock:
+            return self._cache.get_message(workout_type, data)
+
+
+def run(service, packages, threads, calls, expected):
+    """Выполнить `calls` запросов в каждом из `threads` потоков."""
+
+    barrier = threading.Barrier(threads + 1)
+    mismatches = []
+
+    def worker(number):
+        rnd = random.Random(number)
+        choices = [rnd.randrange(len(packages)) for _ in range(calls)]
+        barrier.wait()
+        for index in choices:
+            if service.message(*packages[index]) != expected[index]:
+                mismatches.append(index)
+
+    workers = [
+        threading.Thread(target=worker, args=(number,))
+        for number in range(threads)
+    ]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    if mismatches:
+        raise AssertionError(f'{len(mismatches)} results differ')
+    return threads * calls / elapsed
+
+
+def main() -> None:
+    """Пропускная способность общего калькулятора по числу потоков."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--packages', type=int, default=20_000)
+    parser.add_argument('--calls', type=int, default=50_000)
+    parser.add_argument('--threads', type=int, nargs='+',
+                        default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    packages = list(Workload(seed=0).packages(args.packages))
+    expected = [
+        homework.read_package(*package).show_training_info().get_message()
+        for package in packages
+    ]
+    print(f'{"threads":>7} {"global lock":>12} {"sharded":>10}  calls/s')
+    for threads in args.threads:
+        calls = args.calls // threads
+        baseline = run(
+            GlobalLockCalculator(), packages, threads, calls, expected
+        )
+        sharded = run(Calculator(), packages, threads, calls, expected)
+        print(f'{threads:>7} {baseline:>12.0f} {sharded:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
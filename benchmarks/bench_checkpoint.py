@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import checkpoint
+import pipeline
+from workload import Workload
+
+
+def main() -> None:
+    """Сравнить расчёт с контрольными точками и сжатием с конвейером."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=300_000)
+    parser.add_argument('--every', type=int, default=checkpoint.EVERY)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'packets.txt')
+        with open(source, 'wb') as stream:
+            Workload().write(stream, args.records)
+
+        output = os.path.join(directory, 'pipeline.txt')
+        started = time.perf_counter()
+        with open(source, encoding='utf-8') as reader, \
+                open(output, 'w', encoding='utf-8') as writer:
+            pipeline.run_pipeline(reader, writer)
+        elapsed = time.perf_counter() - started
+        plain_size = os.path.getsize(output)
+        print(f'{"case":<16} {"rec/s":>10} {"MB out":>8} {"ratio":>6}')
+        print(f'{"pipeline":<16} {args.records / elapsed:>10.0f} '
+              f'{plain_size / 1e6:>8.1f} {1:>6.2f}')
+
+        for compression in sorted(checkpoint.COMPRESSORS):
+            output = os.path.join(directory, f'out.{compression}')
+            started = time.perf_counter()
+            checkpoint.run_checkpointed(
+                source, output, every=args.every, compression=compression
+            )
+            elapsed = time.perf_counter() - started
+            size = os.path.getsize(output)
+            print(f'{"checkpoint " + compression:<16} '
+                  f'{args.records / elapsed:>10.0f} {size / 1e6:>8.1f} '
+                  f'{plain_size / size:>6.2f}')
+
+
+if __name__ == '__main__':
+    main()
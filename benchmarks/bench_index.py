@@ -0,0 +1,76 @@
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import packets
+from index import WorkoutIndex
+from workload import Workload
+
+HOUR = 3600.0
+
+
+def main() -> None:
+    """Сравнить запросы по индексу с полным перебором результатов."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=300_000)
+    parser.add_argument('--batch', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    lines = (line.encode() for line in Workload().records(args.records))
+    messages = list(packets.compute(packets.parse_packets(lines)))
+    moments = [number * HOUR for number in range(len(messages))]
+
+    workouts = WorkoutIndex()
+    for start in range(0, len(messages), args.batch):
+        workouts.extend(
+            messages[start:start + args.batch],
+            moments[start:start + args.batch],
+        )
+        workouts.query('Running', calories=(0, None))
+        workouts.query('Swimming', calories=(0, None))
+        workouts.query('SportsWalking', calories=(0, None))
+    span = (moments[len(moments) // 3], moments[len(moments) // 3 * 2])
+
+    def scan():
+        return [
+            info for info, moment in zip(messages, moments)
+            if info.training_type == 'Running' and info.calories >= 500
+            and span[0] <= moment < span[1]
+        ]
+
+    def query():
+        return workouts.query(
+            'Running', calories=(500, None), timestamp=span
+        )
+
+    def top_scan():
+        swims = [info for info in messages if info.training_type == 'Swimming']
+        return sorted(swims, key=lambda info: info.speed)[-10:]
+
+    def top_index():
+        return workouts.top('Swimming', 'speed', 10)
+
+    assert scan() == query()
+    print(f'{"case":<16} {"seconds":>10}')
+    for name, function in [('range, scan', scan), ('range, index', query),
+                           ('top-10, scan', top_scan),
+                           ('top-10, index', top_index)]:
+        elapsed = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f'{name:<16} {elapsed:>10.6f}')
+
+    def merge():
+        workouts.extend(messages[:args.batch], moments[:args.batch])
+        for training_type in ('Running', 'Swimming', 'SportsWalking'):
+            workouts.query(training_type)
+
+    elapsed = min(timeit.repeat(merge, number=1, repeat=args.repeat))
+    print(f'{"merge batch":<16} {elapsed:>10.6f}')
+
+if __name__ == '__main__':
+    main()
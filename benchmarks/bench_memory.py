@@ -0,0 +1,57 @@
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import homework
+import store
+from workload import Workload
+
+
+def measure(build, count):
+    """Вернуть прирост памяти на запись при построении коллекции."""
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    collection = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del collection
+    return (after - before) / count
+
+
+def main() -> None:
+    """Сравнить память на запись: объекты тренировок и TrainingStore."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f'{"type":>4} {"objects":>8} {"store":>6} {"columns":>8}')
+    for workout_type in store.TRAINING_TYPES:
+        packages = list(
+            Workload(mix={workout_type: 1.0}).packages(args.records)
+        )
+
+        def build_objects():
+            return [homework.read_package(*package) for package in packages]
+
+        def build_store():
+            training_store = store.TrainingStore()
+            training_store.extend(packages)
+            return training_store
+
+        objects = measure(build_objects, args.records)
+        columns = measure(build_store, args.records)
+        training_store = build_store()
+        print(
+            f'{workout_type:>4} {objects:>8.1f} {columns:>6.1f} '
+            f'{training_store.nbytes / args.records:>8.1f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
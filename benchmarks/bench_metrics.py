@@ -0,0 +1,51 @@
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def per_record(training_class, data, reads, number):
+    """Время на запись: создать объект и `reads` раз снять сообщение."""
+
+    def run():
+        training = training_class(*data)
+        for _ in range(reads):
+            training.show_training_info()
+    return min(timeit.repeat(run, number=number, repeat=5)) * 1e9 / number
+
+
+def main() -> None:
+    """Сравнить время на запись с кешем метрик и без него."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=200_000)
+    parser.add_argument('--reads', type=int, nargs='+', default=[1, 3, 10])
+    args = parser.parse_args()
+
+    print(f'{"type":>4} {"reads":>5} {"plain":>7} {"cached":>7} '
+          f'{"saving":>7}  ns/rec')
+    for workout_type, data in PACKAGES:
+        plain_class = type(homework.read_package(workout_type, data))
+        cached_class = homework.with_cached_metrics(plain_class)
+        for reads in args.reads:
+            plain = per_record(plain_class, data, reads, args.number)
+            cached = per_record(cached_class, data, reads, args.number)
+            print(
+                f'{workout_type:>4} {reads:>5} {plain:>7.0f} {cached:>7.0f} '
+                f'{plain - cached:>7.0f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
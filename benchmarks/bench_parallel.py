@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import parallel
+
+SAMPLE_PACKETS = (
+    'SWM,720,1,80,25,40\n'
+    'RUN,15000,1,75\n'
+    'WLK,9000,1,75,180\n'
+)
+
+
+def main() -> None:
+    """Замерить масштабирование параллельного режима по числу процессов."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=600_000)
+    parser.add_argument(
+        '--shard-size', type=int, default=None,
+        help='по умолчанию — parallel.shard_size_for для каждого числа '
+        'процессов',
+    )
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'packets.txt')
+        with open(path, 'w', encoding='utf-8') as stream:
+            stream.write(SAMPLE_PACKETS * (args.records // 3))
+        baseline = None
+        print(f'{"workers":>7} {"seconds":>8} {"rec/s":>10} {"speedup":>7}')
+        for workers in range(1, args.max_workers + 1):
+            with open(os.devnull, 'w', encoding='utf-8') as destination:
+                started = time.perf_counter()
+                records = parallel.run_parallel(
+                    path, destination, workers, args.shard_size
+                )
+                elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(
+                f'{workers:>7} {elapsed:>8.3f} {records / elapsed:>10.0f} '
+                f'{baseline / elapsed:>7.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import packets
+import pipeline
+from workload import Workload
+
+
+def main() -> None:
+    """Сравнить разбор и расчёт без проверки пакетов и с проверкой."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=300_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    text_lines = list(Workload(args.seed).records(args.records))
+    byte_lines = [line.encode() for line in text_lines]
+    records = len(text_lines)
+    cases = {
+        'parse, unchecked': lambda: pipeline.parse_packets(text_lines),
+        'parse, validated': lambda: packets.parse_packets(byte_lines),
+        'compute, unchecked': lambda: pipeline.compute(
+            pipeline.parse_packets(text_lines)
+        ),
+        'compute, validated': lambda: packets.compute(
+            packets.parse_packets(byte_lines)
+        ),
+    }
+    print(f'{"case":<20} {"rec/s":>10}')
+    for name, make in cases.items():
+        elapsed = min(timeit.repeat(
+            lambda: sum(1 for _ in make()), number=1, repeat=args.repeat
+        ))
+        print(f'{name:<20} {records / elapsed:>10.0f}')
+
+
+if __name__ == '__main__':
+    main()
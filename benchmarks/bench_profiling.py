@@ -0,0 +1,52 @@
+import argparse
+import sys
+import timeit
+from io import StringIO
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import instrumentation
+import pipeline
+
+SAMPLE_PACKETS = (
+    'SWM,720,1,80,25,40\n'
+    'RUN,15000,1,75\n'
+    'WLK,9000,1,75,180\n'
+)
+
+
+def per_record(packets, records, repeat):
+    """Время конвейера на запись в наносекундах."""
+
+    def run():
+        pipeline.run_pipeline(StringIO(packets), StringIO())
+    return min(timeit.repeat(run, number=1, repeat=repeat)) * 1e9 / records
+
+
+def main() -> None:
+    """Сравнить конвейер без профилировщика, после выключения и с ним."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=30_000)
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    packets = SAMPLE_PACKETS * (args.records // 3)
+    records = args.records // 3 * 3
+    never = per_record(packets, records, args.repeat)
+    profiler = instrumentation.Profiler()
+    profiler.enable()
+    enabled = per_record(packets, records, args.repeat)
+    profiler.disable()
+    disabled = per_record(packets, records, args.repeat)
+    print(f'{"mode":<18} {"ns/rec":>8} {"overhead":>9}')
+    for mode, value in (('never enabled', never),
+                        ('enabled', enabled),
+                        ('disabled again', disabled)):
+        print(f'{mode:<18} {value:>8.0f} {(value / never - 1) * 100:>8.1f}%')
+
+
+if __name__ == '__main__':
+    main()
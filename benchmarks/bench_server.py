@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import server
+
+PACKETS = [
+    b'SWM,720,1,80,25,40\n',
+    b'RUN,15000,1,75\n',
+    b'WLK,9000,1,75,180\n',
+]
+
+
+async def client(port, messages, window, latencies):
+    """Отправлять пакеты, держа не больше `window` неотвеченных."""
+
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    sent = []
+    in_flight = asyncio.Semaphore(window)
+
+    async def send():
+        for index in range(messages):
+            await in_flight.acquire()
+            sent.append(time.perf_counter())
+            writer.write(PACKETS[index % len(PACKETS)])
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for index in range(messages):
+        await reader.readline()
+        latencies.append(time.perf_counter() - sent[index])
+        in_flight.release()
+    await sender
+    writer.close()
+
+
+async def run(args, batch_window):
+    """Замерить задержку и пропускную способность для окна пачки."""
+
+    workout_server = server.WorkoutServer(
+        batch_size=args.batch_size, batch_window=batch_window
+    )
+    await workout_server.start()
+    latencies = []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client(workout_server.port, args.messages, args.window, latencies)
+        for _ in range(args.clients)
+    ))
+    elapsed = time.perf_counter() - started
+    await workout_server.close()
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f'{batch_window * 1000:>9.1f} {quantiles[49] * 1000:>8.3f} '
+        f'{quantiles[98] * 1000:>8.3f} {len(latencies) / elapsed:>9.0f} '
+        f'{workout_server.processed / workout_server.batches:>7.1f}'
+    )
+
+
+def main() -> None:
+    """Нагрузить сервер через loopback и вывести p50/p99 и сообщений/с."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--messages', type=int, default=5000)
+    parser.add_argument('--window', type=int, default=64)
+    parser.add_argument('--batch-size', type=int, default=server.BATCH_SIZE)
+    parser.add_argument(
+        '--batch-windows', type=float, nargs='+', default=[0, 0.001, 0.005]
+    )
+    args = parser.parse_args()
+
+    print(f'{"window,ms":>9} {"p50,ms":>8} {"p99,ms":>8} {"msg/s":>9} '
+          f'{"batch":>7}')
+    for batch_window in args.batch_windows:
+        asyncio.run(run(args, batch_window))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import pickle
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import packets
+from sketches import WorkoutStats
+from workload import Workload
+
+
+def exact(messages, users):
+    """Точная статистика: все значения в списках и множество пользователей."""
+
+    columns = {}
+    for info, user in zip(messages, users):
+        speeds, calories, seen = columns.setdefault(
+            info.training_type, ([], [], set())
+        )
+        speeds.append(info.speed)
+        calories.append(info.calories)
+        seen.add(user)
+    return {
+        training_type: {
+            'count': len(speeds),
+            'speed_p50': statistics.median(speeds),
+            'calories_p99': statistics.quantiles(calories, n=100)[-1],
+            'users': len(seen),
+        }
+        for training_type, (speeds, calories, seen) in columns.items()
+    }
+
+
+def sketched(messages, users):
+    stats = WorkoutStats()
+    stats.update(messages, users)
+    return stats
+
+
+def measure(function, *args):
+    """Время без трассировки памяти, затем пик памяти отдельным запуском."""
+
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    """Сравнить скетчи с точной статистикой по скорости, памяти и ошибке."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=300_000)
+    parser.add_argument('--users', type=int, default=50_000)
+    args = parser.parse_args()
+
+    lines = (line.encode() for line in Workload().records(args.records))
+    messages = list(packets.compute(packets.parse_packets(lines)))
+    users = [number % args.users for number in range(len(messages))]
+
+    expected, exact_seconds, exact_peak = measure(exact, messages, users)
+    stats, sketch_seconds, sketch_peak = measure(sketched, messages, users)
+    size = len(pickle.dumps(stats))
+    print(f'{"case":<10} {"seconds":>10} {"peak, KiB":>12}')
+    print(f'{"exact":<10} {exact_seconds:>10.3f} {exact_peak / 1024:>12.0f}')
+    print(f'{"sketches":<10} {sketch_seconds:>10.3f} '
+          f'{sketch_peak / 1024:>12.0f}')
+    print(f'pickled sketches: {size / 1024:.0f} KiB')
+
+    summary = stats.summary()
+    print(f'{"type":<14} {"key":<14} {"exact":>12} {"sketch":>12} '
+          f'{"error":>8}')
+    for training_type, values in sorted(expected.items()):
+        for key, value in values.items():
+            estimate = summary[training_type][key]
+            error = abs(estimate - value) / abs(value) if value else 0.0
+            print(f'{training_type:<14} {key:<14} {value:>12.3f} '
+                  f'{estimate:>12.3f} {error:>8.2%}')
+
+
+if __name__ == '__main__':
+    main()
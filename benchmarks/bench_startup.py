@@ -0,0 +1,82 @@
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+BUDGET_MS = 40.0
+PREFIX = 'import time:'
+PACKAGE = 'RUN,15000,1,75'
+
+
+def import_times(module: str) -> dict:
+    """Запустить `python -X importtime` и вернуть время импорта модулей.
+
+    Значения — собственное и накопленное время в микросекундах,
+    ключ — имя модуля без отступа.
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BASE_DIR, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith(PREFIX) or 'cumulative' in line:
+            continue
+        own, cumulative, name = line[len(PREFIX):].split('|')
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def wall_time(arguments: list) -> float:
+    """Вернуть время запуска интерпретатора с аргументами в секундах."""
+
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *arguments], cwd=BASE_DIR,
+        stdout=subprocess.DEVNULL, check=True,
+    )
+    return time.perf_counter() - started
+
+
+def main() -> int:
+    """Замерить холодный старт CLI и сравнить импорт модуля с бюджетом."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--top', type=int, default=8)
+    parser.add_argument(
+        '--budget-ms', type=float, default=BUDGET_MS,
+        help='допустимое время импорта homework, мс',
+    )
+    args = parser.parse_args()
+
+    runs = [import_times('homework') for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times['homework'][1])
+    import_ms = best['homework'][1] / 1000
+    print(f'{"module":<24} {"self, ms":>10} {"total, ms":>10}')
+    heaviest = sorted(best.items(), key=lambda item: -item[1][0])
+    for name, (own, cumulative) in heaviest[:args.top]:
+        print(f'{name:<24} {own / 1000:>10.2f} {cumulative / 1000:>10.2f}')
+
+    cases = {
+        'python -c pass': ['-c', 'pass'],
+        f'homework.py {PACKAGE}': ['homework.py', PACKAGE],
+        f'homework.py --batch {PACKAGE}': ['homework.py', '--batch', PACKAGE],
+    }
+    print()
+    for name, arguments in cases.items():
+        elapsed = min(wall_time(arguments) for _ in range(args.repeat))
+        print(f'{name:<40} {elapsed * 1000:>8.1f} ms')
+
+    print(f'\nimport homework: {import_ms:.1f} ms, '
+          f'budget {args.budget_ms:.1f} ms')
+    return 0 if import_ms <= args.budget_ms else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
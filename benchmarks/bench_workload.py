@@ -0,0 +1,37 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+from workload import Workload
+
+
+def main() -> None:
+    """Замерить скорость генерации пакетов: построчно и блоками."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--records', type=int, default=500_000)
+    parser.add_argument('--chunk-records', type=int, default=20_000_000)
+    parser.add_argument('--malformed', type=float, default=0.01)
+    args = parser.parse_args()
+
+    workload = Workload(malformed=args.malformed)
+    cases = {
+        'records': lambda: workload.records(args.records),
+        'chunks': lambda: workload.chunks(args.chunk_records),
+    }
+    counts = {'records': args.records, 'chunks': args.chunk_records}
+    print(f'{"case":<10} {"rec/s":>12} {"MB/s":>10}')
+    for name, make in cases.items():
+        started = time.perf_counter()
+        size = sum(map(len, make()))
+        elapsed = time.perf_counter() - started
+        print(f'{name:<10} {counts[name] / elapsed:>12.0f} '
+              f'{size / elapsed / 1e6:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from contextlib import redirect_stdout
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+SIZES = [1, 10_000, 1_000_000]
+OUTPUT = 'bench_results.json'
+
+
+def measure(function, number, repeat):
+    """Замерить функцию, вернуть время одного вызова в наносекундах."""
+
+    timings = [
+        total / number * 1e9
+        for total in timeit.repeat(function, number=number, repeat=repeat)
+    ]
+    return {
+        'min_ns': min(timings),
+        'median_ns': statistics.median(timings),
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def stage_benchmarks(number, repeat):
+    """Замерить отдельные этапы расчёта по видам тренировок."""
+
+    results = {}
+    for workout_type, data in PACKAGES:
+        training = homework.read_package(workout_type, data)
+        info = training.show_training_info()
+        results[f'read_package[{workout_type}]'] = measure(
+            lambda: homework.read_package(workout_type, data), number, repeat
+        )
+        results[f'get_spent_calories[{workout_type}]'] = measure(
+            training.get_spent_calories, number, repeat
+        )
+        results[f'show_training_info[{workout_type}]'] = measure(
+            training.show_training_info, number, repeat
+        )
+        results[f'get_message[{workout_type}]'] = measure(
+            info.get_message, number, repeat
+        )
+    return results
+
+
+def end_to_end(size, repeat):
+    """Замерить `read_package` и `main` для `size` записей."""
+
+    packages = [PACKAGES[index % len(PACKAGES)] for index in range(size)]
+
+    def run():
+        for workout_type, data in packages:
+            homework.main(homework.read_package(workout_type, data))
+
+    with open(os.devnull, 'w', encoding='utf-8') as devnull:
+        with redirect_stdout(devnull):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                run()
+                timings.append(time.perf_counter() - started)
+    return {
+        'records': size,
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'records_per_s': size / min(timings),
+        'repeat': repeat,
+    }
+
+
+def git_revision():
+    """Вернуть текущую ревизию git или None."""
+
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline_path):
+    """Вывести отношение времени к сохранённому прогону."""
+
+    with open(baseline_path, encoding='utf-8') as stream:
+        baseline = json.load(stream)
+    print(f'{"benchmark":<32} {"baseline":>10} {"current":>10} {"ratio":>6}')
+    for section, key in (('stages', 'min_ns'), ('end_to_end', 'min_s')):
+        for name, result in current[section].items():
+            old = baseline.get(section, {}).get(name)
+            if old is None:
+                continue
+            print(
+                f'{name:<32} {old[key]:>10.4g} {result[key]:>10.4g} '
+                f'{result[key] / old[key]:>6.2f}'
+            )
+
+
+def main() -> None:
+    """Прогнать набор замеров и сохранить результаты в JSON."""
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-o', '--output', default=OUTPUT)
+    parser.add_argument('--number', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--compare', help='JSON прошлого прогона')
+    args = parser.parse_args()
+
+    results = {
+        'meta': {
+            'python': sys.version,
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'revision': git_revision(),
+            'timestamp': time.time(),
+        },
+        'stages': stage_benchmarks(args.number, args.repeat),
+        'end_to_end': {
+            f'main[{size}]': end_to_end(
+                size, args.repeat if size < 1_000_000 else 1
+            )
+            for size in args.sizes
+        },
+    }
+    with open(args.output, 'w', encoding='utf-8') as stream:
+        json.dump(results, stream, indent=2)
+    for name, result in results['stages'].items():
+        print(f'{name:<32} {result["min_ns"]:>10.0f} ns')
+    for name, result in results['end_to_end'].items():
+        print(f'{name:<32} {result["records_per_s"]:>10.0f} rec/s')
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
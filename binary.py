@@ -0,0 +1,169 @@
+import mmap
+import os
+from struct import Struct
+from typing import IO, Dict, Iterable, Iterator, List
+
+import homework
+
+MAGIC: bytes = b'WKTR'
+VERSION: int = 1
+HEADER = Struct('<4sHH8x')
+RECORD = Struct('<B7xdddd')
+TYPE_NAMES: List[str] = ['Swimming', 'Running', 'SportsWalking']
+TYPE_CODES: Dict[str, int] = {
+    name: code for code, name in enumerate(TYPE_NAMES)
+}
+MAX_TYPES: int = 256
+WRITE_BATCH: int = 4096
+
+
+def add_type_name(training_type: str) -> int:
+    """Выдать код виду тренировки для двоичного файла и вернуть его.
+
+    Код — позиция имени в TYPE_NAMES, он хранится в файле, поэтому
+    список только дополняется. Вид, добавленный через
+    `homework.register`, получает код этим вызовом; процессы, которые
+    пишут и читают одни файлы, должны добавлять виды в одном порядке.
+    Повторный вызов возвращает прежний код.
+    """
+
+    code = TYPE_CODES.get(training_type)
+    if code is None:
+        if len(TYPE_NAMES) >= MAX_TYPES:
+            raise ValueError(f'No codes left for {training_type}')
+        code = TYPE_CODES[training_type] = len(TYPE_NAMES)
+        TYPE_NAMES.append(training_type)
+    return code
+
+
+class ResultWriter:
+    """Запись сообщений о тренировках в двоичный файл фиксированной ширины.
+
+    Заголовок 16 байт, затем записи по 40 байт: код вида тренировки
+    (индекс в TYPE_NAMES), 7 байт выравнивания и четыре float64 —
+    длительность, дистанция, скорость и калории без округления.
+    """
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self._stream = stream
+        if stream.tell() == 0:
+            stream.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        self.written = 0
+
+    @classmethod
+    def open(cls, path: str, append: bool = False) -> 'ResultWriter':
+        """Открыть файл результатов для записи."""
+
+        return cls(open(path, 'ab' if append else 'wb'))
+
+    def write(self, info: homework.InfoMessage) -> None:
+        """Записать одно сообщение."""
+
+        self._stream.write(self._pack(info))
+        self.written += 1
+
+    def write_many(self, messages: Iterable[homework.InfoMessage]) -> None:
+        """Записать сообщения пачками."""
+
+        batch = []
+        pack = self._pack
+        for info in messages:
+            batch.append(pack(info))
+            if len(batch) >= WRITE_BATCH:
+                self._stream.write(b''.join(batch))
+                self.written += len(batch)
+                batch.clear()
+        self._stream.write(b''.join(batch))
+        self.written += len(batch)
+
+    @staticmethod
+    def _pack(info: homework.InfoMessage) -> bytes:
+        try:
+            code = TYPE_CODES[info.training_type]
+        except KeyError:
+            raise ValueError(
+                f'Unknown training type: {info.training_type}, '
+                f'add it with binary.add_type_name'
+            ) from None
+        return RECORD.pack(
+            code, info.duration, info.distance, info.speed, info.calories
+        )
+
+    def close(self) -> None:
+        """Закрыть файл."""
+
+        self._stream.close()
+
+    def __enter__(self) -> 'ResultWriter':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _check_header(header: bytes) -> None:
+    """Проверить заголовок файла результатов."""
+
+    if len(header) < HEADER.size:
+        raise ValueError('File is too short for a results header')
+    magic, version, record_size = HEADER.unpack_from(header)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        raise ValueError(
+            f'Unsupported results file: {magic!r} v{version}, '
+            f'record {record_size} bytes'
+        )
+
+
+def record_dtype():
+    """Вернуть структурный тип NumPy, совпадающий с форматом записи."""
+
+    import numpy as np
+
+    return np.dtype([
+        ('type', 'u1'),
+        ('_pad', 'V7'),
+        ('duration', '<f8'),
+        ('distance', '<f8'),
+        ('speed', '<f8'),
+        ('calories', '<f8'),
+    ])
+
+
+def read_results(path: str):
+    """Отобразить файл в память и вернуть структурный массив NumPy.
+
+    Колонки (`records['calories']` и т. п.) — представления над файлом
+    без копирования. Недописанная последняя запись не возвращается.
+    Требует NumPy.
+    """
+
+    import numpy as np
+
+    dtype = record_dtype()
+    with open(path, 'rb') as stream:
+        _check_header(stream.read(HEADER.size))
+    count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    if not count:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(
+        path, dtype=dtype, mode='r', offset=HEADER.size, shape=(count,)
+    )
+
+
+def iter_results(path: str) -> Iterator[homework.InfoMessage]:
+    """Перебрать записи файла как InfoMessage без NumPy."""
+
+    with open(path, 'rb') as stream:
+        _check_header(stream.read(HEADER.size))
+        if os.fstat(stream.fileno()).st_size == HEADER.size:
+            return
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = HEADER.size + (
+                (len(data) - HEADER.size) // RECORD.size * RECORD.size
+            )
+            view = memoryview(data)[HEADER.size:end]
+            try:
+                for code, *values in RECORD.iter_unpack(view):
+                    yield homework.InfoMessage(TYPE_NAMES[code], *values)
+            finally:
+                view.release()
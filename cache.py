@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Sequence, Tuple
+
+import homework
+
+MAXSIZE: int = 65536
+
+Entry = Tuple[homework.InfoMessage, str]
+
+
+class PackageCache:
+    """Ограниченный LRU-кеш результатов расчёта по пакету датчиков.
+
+    Ключ — `(workout_type, tuple(data))`. Возвращаемые объекты
+    `InfoMessage` общие для всех совпавших пакетов, их нельзя изменять.
+    """
+
+    def __init__(self, maxsize: int = MAXSIZE) -> None:
+        if maxsize < 1:
+            raise ValueError(f'Cache size must be positive: {maxsize}')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Hashable, Entry]' = OrderedDict()
+
+    def _lookup(self, workout_type: str, data: Sequence[float]) -> Entry:
+        """Найти результат в кеше или рассчитать и запомнить его."""
+
+        key = (workout_type, tuple(data))
+        entries = self._entries
+        entry = entries.get(key)
+        if entry is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        info = homework.read_package(workout_type, data).show_training_info()
+        entry = entries[key] = (info, info.get_message())
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def get_info(
+            self,
+            workout_type: str,
+            data: Sequence[float],
+    ) -> homework.InfoMessage:
+        """Вернуть информационное сообщение для пакета."""
+
+        return self._lookup(workout_type, data)[0]
+
+    def get_message(self, workout_type: str, data: Sequence[float]) -> str:
+        """Вернуть строку сообщения для пакета."""
+
+        return self._lookup(workout_type, data)[1]
+
+    def clear(self) -> None:
+        """Очистить кеш, сохранив счётчики."""
+
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Вернуть счётчики кеша."""
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
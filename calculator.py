@@ -0,0 +1,169 @@
+import threading
+import weakref
+from typing import (IO, Callable, Dict, Iterable, MutableMapping, Sequence,
+                    Tuple, TypeVar)
+
+import homework
+from cache import MAXSIZE, PackageCache
+
+SHARDS: int = 16
+COUNTERS: Tuple[str, ...] = ('requests', 'errors', 'writes', 'lines')
+
+Package = Tuple[str, Sequence[float]]
+T = TypeVar('T')
+
+
+class _TableHolder:
+    """Словарь счётчиков потока; живёт, пока жив поток."""
+    __slots__ = ('table', '__weakref__')
+
+    def __init__(self) -> None:
+        self.table = dict.fromkeys(COUNTERS, 0)
+
+
+class ThreadCounters:
+    """Счётчики, которые каждый поток ведёт в своём словаре.
+
+    Запись не берёт блокировок: поток меняет только свой словарь
+    с заранее созданными ключами COUNTERS, поэтому размер словаря
+    не меняется и чтение из другого потока безопасно. `snapshot()`
+    складывает словари живых потоков и общий итог завершившихся:
+    при завершении потока его словарь прибавляется к итогу
+    и удаляется, поэтому память не растёт с числом потоков.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._tables: Dict[int, Dict[str, int]] = {}
+        self._retired = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.RLock()
+
+    def table(self) -> Dict[str, int]:
+        """Вернуть словарь счётчиков текущего потока."""
+
+        try:
+            return self._local.holder.table
+        except AttributeError:
+            holder = self._local.holder = _TableHolder()
+            key = id(holder)
+            with self._lock:
+                self._tables[key] = holder.table
+            weakref.finalize(holder, self._retire, key)
+            return holder.table
+
+    def _retire(self, key: int) -> None:
+        """Перенести счёт завершившегося потока в общий итог."""
+
+        with self._lock:
+            table = self._tables.pop(key)
+            for name in COUNTERS:
+                self._retired[name] += table[name]
+
+    def snapshot(self) -> Dict[str, int]:
+        """Сложить счётчики всех потоков."""
+
+        with self._lock:
+            tables = list(self._tables.values())
+            totals = dict(self._retired)
+        for table in tables:
+            for name in COUNTERS:
+                totals[name] += table[name]
+        return totals
+
+
+class Calculator:
+    """Общий для потоков расчёт тренировок с кешем и счётчиками.
+
+    Кеш разбит на `shards` независимых PackageCache со своими
+    блокировками; пакет попадает в шард по хешу, так что потоки
+    с разными пакетами почти не ждут друг друга. Промах считается
+    под блокировкой своего шарда: одинаковые пакеты из разных потоков
+    рассчитываются один раз. Запись в поток вывода собирает текст
+    без блокировок и отдаёт его одним вызовом под блокировкой
+    этого потока, поэтому строки разных потоков не перемешиваются.
+    """
+
+    def __init__(self, maxsize: int = MAXSIZE, shards: int = SHARDS) -> None:
+        if shards < 1:
+            raise ValueError(f'Shard count must be positive: {shards}')
+        self._shards = [
+            PackageCache(max(1, maxsize // shards)) for _ in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._counters = ThreadCounters()
+        self._sink_locks: MutableMapping[IO[str], threading.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._sink_locks_lock = threading.Lock()
+
+    def _call(
+            self,
+            getter: Callable[[PackageCache, str, Sequence[float]], T],
+            workout_type: str,
+            data: Sequence[float],
+    ) -> T:
+        counters = self._counters.table()
+        counters['requests'] += 1
+        data = tuple(data)
+        shard = hash((workout_type, data)) % len(self._shards)
+        try:
+            with self._locks[shard]:
+                return getter(self._shards[shard], workout_type, data)
+        except (ValueError, TypeError, ArithmeticError):
+            counters['errors'] += 1
+            raise
+
+    def info(
+            self,
+            workout_type: str,
+            data: Sequence[float],
+    ) -> homework.InfoMessage:
+        """Вернуть информационное сообщение для пакета."""
+
+        return self._call(PackageCache.get_info, workout_type, data)
+
+    def message(self, workout_type: str, data: Sequence[float]) -> str:
+        """Вернуть строку сообщения для пакета."""
+
+        return self._call(PackageCache.get_message, workout_type, data)
+
+    def _sink_lock(self, sink: IO[str]) -> threading.Lock:
+        lock = self._sink_locks.get(sink)
+        if lock is None:
+            with self._sink_locks_lock:
+                lock = self._sink_locks.setdefault(sink, threading.Lock())
+        return lock
+
+    def write(self, packages: Iterable[Package], sink: IO[str]) -> int:
+        """Рассчитать пакеты и записать сообщения в `sink` одним вызовом."""
+
+        lines = [
+            self.message(workout_type, data) + '\n'
+            for workout_type, data in packages
+        ]
+        text = ''.join(lines)
+        with self._sink_lock(sink):
+            sink.write(text)
+        counters = self._counters.table()
+        counters['writes'] += 1
+        counters['lines'] += len(lines)
+        return len(lines)
+
+    def clear(self) -> None:
+        """Очистить кеш, сохранив счётчики."""
+
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Вернуть счётчики потоков и сумму счётчиков шардов кеша."""
+
+        totals = self._counters.snapshot()
+        for name in ('hits', 'misses', 'evictions', 'size', 'maxsize'):
+            totals[name] = 0
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                for name, value in shard.stats().items():
+                    totals[name] += value
+        return totals
@@ -0,0 +1,231 @@
+import argparse
+import bz2
+import gzip
+import json
+import lzma
+import os
+import sys
+from functools import partial
+from io import StringIO
+from itertools import islice
+from typing import IO, Callable, Dict, NamedTuple, Optional, Sequence
+
+import homework
+import packets
+
+EVERY: int = 100_000
+VERSION: int = 2
+
+COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    'none': bytes,
+    'gzip': partial(gzip.compress, compresslevel=6),
+    'bz2': bz2.compress,
+    'xz': partial(lzma.compress, preset=1),
+}
+SUFFIXES: Dict[str, str] = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}
+OPENERS: Dict[str, Callable[..., IO[bytes]]] = {
+    'none': open,
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+
+class Checkpoint(NamedTuple):
+    """Прогресс пакетного расчёта на момент последней контрольной точки."""
+    source: str
+    compression: str
+    input_offset: int
+    output_offset: int
+    lines: int
+    rejects_offset: int = 0
+    rejected: int = 0
+    complete: bool = False
+
+
+def compression_for(path: str) -> str:
+    """Определить сжатие по расширению файла."""
+
+    return SUFFIXES.get(os.path.splitext(path)[1], 'none')
+
+
+def load_checkpoint(path: str) -> Optional[Checkpoint]:
+    """Прочитать контрольную точку, None — если её нет."""
+
+    try:
+        with open(path, encoding='utf-8') as stream:
+            state = json.load(stream)
+    except FileNotFoundError:
+        return None
+    if state.pop('version', None) != VERSION:
+        raise ValueError(f'Unsupported checkpoint: {path}')
+    return Checkpoint(**state)
+
+
+def save_checkpoint(path: str, state: Checkpoint) -> None:
+    """Записать контрольную точку атомарно: temp-файл, fsync, replace."""
+
+    temporary = f'{path}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as stream:
+        json.dump({'version': VERSION, **state._asdict()}, stream)
+        stream.flush()
+        os.fsync(stream.fileno())
+    os.replace(temporary, path)
+
+
+def _block_rejects(
+        first_line: int,
+        stream: IO[str],
+) -> Callable[[packets.Reject], None]:
+    """Писать отклонённые строки блока с номерами строк всего файла."""
+
+    write = packets.reject_writer(stream)
+
+    def reject(item: packets.Reject) -> None:
+        write(item._replace(line_number=first_line + item.line_number))
+    return reject
+
+
+def _require_size(path: str, size: int) -> None:
+    """Проверить, что файл на месте и не короче контрольной точки."""
+
+    try:
+        actual = os.path.getsize(path)
+    except FileNotFoundError:
+        raise ValueError(f'{path} is missing, cannot resume') from None
+    if actual < size:
+        raise ValueError(f'{path} is shorter than the checkpoint')
+
+
+def run_checkpointed(
+        source: str,
+        destination: str,
+        checkpoint: Optional[str] = None,
+        every: int = EVERY,
+        compression: Optional[str] = None,
+        restart: bool = False,
+        rejects: Optional[str] = None,
+) -> int:
+    """Рассчитать файл пакетов с контрольными точками, вернуть число строк.
+
+    Каждые `every` строк вывод сбрасывается на диск (fsync), затем
+    контрольная точка `checkpoint` (по умолчанию `<destination>.checkpoint`)
+    атомарно фиксирует смещения во входе и в выводе. Повторный запуск
+    продолжает с последней точки: хвост вывода после неё обрезается,
+    поэтому строки не теряются и не повторяются. Со сжатием (`gzip`,
+    `bz2`, `xz`, по умолчанию по расширению вывода) каждый блок — отдельный
+    член потока; такие файлы читают gzip.open, bz2.open и lzma.open.
+    Сжатый вход читается по расширению, но при продолжении распаковывается
+    с начала до сохранённого смещения.
+
+    Строки, не прошедшие проверку `packets`, не останавливают расчёт:
+    они пишутся в журнал `rejects` (по умолчанию `<destination>.rejects`)
+    с номером строки файла и причиной, их число хранится в контрольной
+    точке. Журнал фиксируется и обрезается вместе с выводом.
+    """
+
+    if every < 1:
+        raise ValueError(f'Checkpoint interval must be positive: {every}')
+    checkpoint = checkpoint or f'{destination}.checkpoint'
+    rejects = rejects or f'{destination}.rejects'
+    compression = compression or compression_for(destination)
+    compress = COMPRESSORS[compression]
+    state = None if restart else load_checkpoint(checkpoint)
+    if state is None:
+        state = Checkpoint(os.path.abspath(source), compression, 0, 0, 0)
+        mode = 'wb'
+    else:
+        if (state.source, state.compression) != (
+                os.path.abspath(source), compression):
+            raise ValueError(
+                f'Checkpoint {checkpoint} belongs to {state.source} '
+                f'with {state.compression} output'
+            )
+        if state.complete:
+            return 0
+        _require_size(destination, state.output_offset)
+        _require_size(rejects, state.rejects_offset)
+        mode = 'r+b'
+
+    opener = OPENERS[compression_for(source)]
+    processed = 0
+    with opener(source, 'rb') as reader, open(destination, mode) as writer, \
+            open(rejects, mode) as reject_log:
+        reader.seek(state.input_offset)
+        for stream, offset in ((writer, state.output_offset),
+                               (reject_log, state.rejects_offset)):
+            stream.seek(offset)
+            stream.truncate()
+        while True:
+            lines = list(islice(reader, every))
+            if not lines:
+                break
+            block_rejects = StringIO()
+            reject = _block_rejects(state.lines, block_rejects)
+            messages = packets.compute(packets.parse_packets(lines, reject))
+            writer.write(compress(homework.format_many(messages).encode()))
+            rejected = block_rejects.getvalue()
+            reject_log.write(rejected.encode())
+            for stream in (writer, reject_log):
+                stream.flush()
+                os.fsync(stream.fileno())
+            state = state._replace(
+                input_offset=state.input_offset + sum(map(len, lines)),
+                output_offset=writer.tell(),
+                lines=state.lines + len(lines),
+                rejects_offset=reject_log.tell(),
+                rejected=state.rejected + rejected.count('\n'),
+            )
+            save_checkpoint(checkpoint, state)
+            processed += len(lines)
+    save_checkpoint(checkpoint, state._replace(complete=True))
+    return processed
+
+
+def cli(argv: Optional[Sequence[str]] = None) -> int:
+    """Точка входа командной строки."""
+
+    parser = argparse.ArgumentParser(
+        description='Рассчитать архив пакетов с возможностью продолжения.',
+    )
+    parser.add_argument('input', help='файл с пакетами (.gz, .bz2, .xz)')
+    parser.add_argument('output', help='файл для сообщений')
+    parser.add_argument(
+        '--checkpoint', help='файл контрольной точки, '
+        'по умолчанию OUTPUT.checkpoint',
+    )
+    parser.add_argument(
+        '--every', type=int, default=EVERY,
+        help='число строк между контрольными точками',
+    )
+    parser.add_argument(
+        '--compression', choices=sorted(COMPRESSORS),
+        help='сжатие вывода, по умолчанию по расширению OUTPUT',
+    )
+    parser.add_argument(
+        '--restart', action='store_true',
+        help='начать заново, не читая контрольную точку',
+    )
+    parser.add_argument(
+        '--rejects', help='журнал отклонённых строк, '
+        'по умолчанию OUTPUT.rejects',
+    )
+    args = parser.parse_args(argv)
+    try:
+        processed = run_checkpointed(
+            args.input, args.output, args.checkpoint, args.every,
+            args.compression, args.restart, args.rejects,
+        )
+    except ValueError as error:
+        print(f'error: {error}', file=sys.stderr)
+        return 1
+    state = load_checkpoint(args.checkpoint or f'{args.output}.checkpoint')
+    print(
+        f'{processed} lines processed, {state.rejected} rejected in total',
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(cli())
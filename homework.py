@@ -1,15 +1,35 @@
-from dataclasses import dataclass, asdict
-
-
-@dataclass()
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from string import Formatter
+from typing import (Callable, Dict, Iterable, List, Optional, Sequence,
+                    TextIO, Tuple, Type)
+
+
+def compile_template(template: str) -> Tuple[str, Callable]:
+    """Перевести шаблон str.format в шаблон оператора % и выборку полей."""
+
+    parts = []
+    fields = []
+    for literal, field, spec, _ in Formatter().parse(template):
+        parts.append(literal.replace('%', '%%'))
+        if field is not None:
+            parts.append('%' + (spec or 's'))
+            fields.append(field)
+    return ''.join(parts), attrgetter(*fields)
+
+
+@dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
     training_type: str
     duration: float
     distance: float
     speed: float
     calories: float
-    training_type: str
     MESSAGE = (
         'Тип тренировки: {training_type}; '
         'Длительность: {duration:.3f} ч.; '
@@ -17,9 +37,74 @@ class InfoMessage:
         'Ср. скорость: {speed:.3f} км/ч; '
         'Потрачено ккал: {calories:.3f}.'
     )
+    _TEMPLATE, _FIELDS = compile_template(MESSAGE)
+
+    def get_message(self) -> str:
+        return self._TEMPLATE % self._FIELDS(self)
+
+
+WRITE_BATCH: int = 4096
+
+
+def format_many(messages: Iterable[InfoMessage]) -> str:
+    """Собрать сообщения в один буфер, по сообщению на строку."""
+
+    line = InfoMessage._TEMPLATE + '\n'
+    fields = InfoMessage._FIELDS
+    return ''.join([line % fields(message) for message in messages])
+
+
+def write_messages(
+        messages: Iterable[InfoMessage],
+        sink: TextIO,
+        batch_size: int = WRITE_BATCH,
+) -> int:
+    """Записать сообщения в поток пачками, вернуть число записанных строк.
+
+    Если источник сообщений падает посреди пачки, уже рассчитанные
+    сообщения пачки записываются до того, как ошибка уйдёт выше.
+    """
 
-    def get_message(self):
-        return self.MESSAGE.format(**asdict(self))
+    if batch_size < 1:
+        raise ValueError(f'Batch size must be positive: {batch_size}')
+    messages = iter(messages)
+    written = 0
+    while True:
+        batch: List[InfoMessage] = []
+        try:
+            batch.extend(islice(messages, batch_size))
+        finally:
+            if batch:
+                sink.write(format_many(batch))
+                written += len(batch)
+        if not batch:
+            return written
+
+
+TRAINING_TYPES: Dict[str, Type['Training']] = {}
+TRAINING_FIELDS: Dict[str, Tuple[str, ...]] = {}
+_DISPATCH: Dict[str, Tuple[Type['Training'], int]] = {}
+
+
+def register(workout_type: str) -> Callable[[Type], Type]:
+    """Зарегистрировать класс тренировки под кодом из пакета датчиков.
+
+    Имена параметров конструктора в порядке пакета сохраняются
+    в TRAINING_FIELDS; остальные модули берут их оттуда.
+    """
+
+    def decorator(training_class: Type['Training']) -> Type['Training']:
+        if workout_type in TRAINING_TYPES:
+            raise ValueError(
+                f'Workout type is already registered: {workout_type}'
+            )
+        code = training_class.__init__.__code__
+        fields = code.co_varnames[1:code.co_argcount]
+        TRAINING_TYPES[workout_type] = training_class
+        TRAINING_FIELDS[workout_type] = fields
+        _DISPATCH[workout_type] = (training_class, len(fields))
+        return training_class
+    return decorator
 
 
 class Training:
@@ -71,6 +156,7 @@ class Training:
         return info
 
 
+@register('RUN')
 class Running(Training):
     """Тренировка: бег."""
     CALORIES_HEIGHT_FACTOR: float = 18
@@ -98,6 +184,7 @@ class Running(Training):
         return spent_calories
 
 
+@register('WLK')
 class SportsWalking(Training):
     """Тренировка: спортивная ходьба."""
 
@@ -127,6 +214,7 @@ class SportsWalking(Training):
         return spent_calories
 
 
+@register('SWM')
 class Swimming(Training):
     """Тренировка: плавание."""
     LEN_STEP: float = 1.38
@@ -163,18 +251,72 @@ class Swimming(Training):
         return spent_calories
 
 
+class CachedMetrics:
+    """Примесь: дистанция, скорость и калории считаются один раз.
+
+    Значения хранятся в экземпляре до записи любого его атрибута.
+    Выгодна для долгоживущих объектов, у которых метрики читают
+    многократно; для одного вызова `show_training_info()` формулы
+    дешевле, чем обслуживание кеша.
+    """
+
+    METRICS: Tuple[str, ...] = ('_distance', '_speed', '_calories')
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        cache = self.__dict__
+        if not cache.keys().isdisjoint(self.METRICS):
+            for metric in self.METRICS:
+                cache.pop(metric, None)
+
+    def get_distance(self) -> float:
+        """Получить дистанцию в км."""
+
+        value = self.__dict__.get('_distance')
+        if value is None:
+            value = self.__dict__['_distance'] = super().get_distance()
+        return value
+
+    def get_mean_speed(self) -> float:
+        """Получить среднюю скорость движения."""
+
+        value = self.__dict__.get('_speed')
+        if value is None:
+            value = self.__dict__['_speed'] = super().get_mean_speed()
+        return value
+
+    def get_spent_calories(self) -> float:
+        """Получить количество затраченных калорий."""
+
+        value = self.__dict__.get('_calories')
+        if value is None:
+            value = self.__dict__['_calories'] = super().get_spent_calories()
+        return value
+
+
+@lru_cache(maxsize=None)
+def with_cached_metrics(training_class: Type[Training]) -> Type[Training]:
+    """Вернуть вариант класса тренировки с кешем производных метрик."""
+
+    return type(
+        training_class.__name__,
+        (CachedMetrics, training_class),
+        {'__doc__': training_class.__doc__},
+    )
+
+
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
 
-    training_cypher = {
-        'SWM': Swimming,
-        'RUN': Running,
-        'WLK': SportsWalking,
-    }
-
-    if workout_type not in training_cypher:
-        raise ValueError(f'This key is not found: {workout_type}')
-    return training_cypher[workout_type](*data)
+    try:
+        training_class, arity = _DISPATCH[workout_type]
+    except KeyError:
+        raise ValueError(f'This key is not found: {workout_type}') from None
+    if len(data) != arity:
+        raise ValueError(
+            f'{workout_type} expects {arity} values, got {len(data)}'
+        )
+    return training_class(*data)
 
 
 def main(training: Training) -> None:
@@ -184,13 +326,122 @@ def main(training: Training) -> None:
     print(info)
 
 
+def main_many(
+        trainings: Iterable[Training],
+        sink: Optional[TextIO] = None,
+        batch_size: int = WRITE_BATCH,
+        flush: bool = True,
+) -> int:
+    """Вывести сообщения о тренировках пачками, вернуть их число.
+
+    Вывод построчно совпадает с вызовом `main()` для каждой тренировки,
+    но в поток `sink` (по умолчанию sys.stdout) уходит одна запись
+    на `batch_size` сообщений. При `flush=False` сброс буфера остаётся
+    вызывающему коду.
+    """
+
+    if sink is None:
+        sink = sys.stdout
+    written = write_messages(
+        (training.show_training_info() for training in trainings),
+        sink, batch_size,
+    )
+    if flush:
+        sink.flush()
+    return written
+
+
+DEMO_PACKAGES: List[Tuple[str, List[float]]] = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+def parse_packages(
+        arguments: Sequence[str],
+        stdin: Optional[TextIO] = None,
+) -> List[Tuple[str, List[float]]]:
+    """Разобрать пакеты вида `RUN,15000,1,75`, `-` читает их из stdin."""
+
+    lines: List[str] = []
+    for argument in arguments:
+        if argument == '-':
+            lines.extend(sys.stdin if stdin is None else stdin)
+        else:
+            lines.append(argument)
+    packages = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            workout_type, *values = line.split(',')
+            packages.append((workout_type, [float(value) for value in values]))
+    return packages
+
+
+def cli(argv: Optional[Sequence[str]] = None) -> int:
+    """Точка входа командной строки для коротких запусков.
+
+    Аргументы — пакеты вида `RUN,15000,1,75`, `-` читает пакеты
+    из стандартного ввода, без аргументов считаются примеры из задания.
+    argparse и NumPy импортируются только при наличии опций, поэтому
+    разовый вызов платит лишь за импорт этого модуля.
+    """
+
+    arguments = sys.argv[1:] if argv is None else list(argv)
+    if any(argument.startswith('-') and argument != '-'
+           for argument in arguments):
+        return _cli_options(arguments)
+    try:
+        packages = parse_packages(arguments) if arguments else DEMO_PACKAGES
+        messages = [
+            read_package(*package).show_training_info()
+            for package in packages
+        ]
+    except (ValueError, ArithmeticError) as error:
+        print(f'error: {error}', file=sys.stderr)
+        return 2
+    write_messages(messages, sys.stdout)
+    sys.stdout.flush()
+    return 0
+
+
+def _cli_options(arguments: Sequence[str]) -> int:
+    """Разобрать опции командной строки и выполнить расчёт."""
+
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Рассчитать тренировки по пакетам датчиков.',
+    )
+    parser.add_argument(
+        'packages', nargs='*',
+        help='пакеты вида RUN,15000,1,75; `-` — стандартный ввод',
+    )
+    parser.add_argument(
+        '--batch', action='store_true',
+        help='считать векторно через NumPy (модуль batch)',
+    )
+    args = parser.parse_args(arguments)
+    try:
+        packages = (
+            parse_packages(args.packages) if args.packages else DEMO_PACKAGES
+        )
+        if args.batch:
+            import batch
+
+            messages = batch.compute_messages(packages)
+        else:
+            messages = [
+                read_package(*package).show_training_info()
+                for package in packages
+            ]
+    except (ValueError, ArithmeticError) as error:
+        parser.error(str(error))
+    sys.stdout.write(format_many(messages))
+    sys.stdout.flush()
+    return 0
+
+
 if __name__ == '__main__':
-    packages = [
-        ('SWM', [720, 1, 80, 25, 40]),
-        ('RUN', [15000, 1, 75]),
-        ('WLK', [9000, 1, 75, 180]),
-    ]
-
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    sys.exit(cli())
@@ -0,0 +1,166 @@
+from bisect import bisect_left
+from datetime import date, datetime, time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import homework
+
+KEYS: Tuple[str, ...] = ('distance', 'speed', 'calories', 'timestamp')
+
+Moment = Union[date, datetime, float]
+Bound = Tuple[Optional[Moment], Optional[Moment]]
+
+
+def to_timestamp(moment: Moment) -> float:
+    """Перевести дату, время или число секунд в POSIX-время."""
+
+    if isinstance(moment, datetime):
+        return moment.timestamp()
+    if isinstance(moment, date):
+        return datetime.combine(moment, time()).timestamp()
+    return float(moment)
+
+
+class _TypeIndex:
+    """Результаты одного вида тренировки и отсортированные ключи."""
+    __slots__ = ('messages', 'columns', 'sorted', 'pending')
+
+    def __init__(self) -> None:
+        self.messages: List[homework.InfoMessage] = []
+        self.columns: Dict[str, List[float]] = {key: [] for key in KEYS}
+        self.sorted: Dict[str, List[Tuple[float, int]]] = {
+            key: [] for key in KEYS
+        }
+        self.pending = 0
+
+    def flush(self) -> None:
+        """Влить новые строки в отсортированные ключи."""
+
+        if not self.pending:
+            return
+        first = len(self.messages) - self.pending
+        for key in KEYS:
+            column = self.columns[key]
+            keys = self.sorted[key]
+            keys.extend(sorted(
+                zip(column[first:], range(first, len(column)))
+            ))
+            keys.sort()
+        self.pending = 0
+
+
+class WorkoutIndex:
+    """Индекс результатов по виду тренировки для запросов по диапазонам.
+
+    Для каждого вида тренировки и ключа из KEYS хранится список пар
+    (значение, номер строки), отсортированный по значению. Новые
+    результаты копятся и вливаются при следующем запросе: пачка
+    сортируется отдельно, а `list.sort` сливает два упорядоченных
+    участка за линейное время, без полной пересортировки.
+    """
+
+    def __init__(self) -> None:
+        self._types: Dict[str, _TypeIndex] = {}
+
+    def add(self, info: homework.InfoMessage, moment: Moment) -> None:
+        """Добавить результат тренировки с моментом её начала."""
+
+        index = self._types.get(info.training_type)
+        if index is None:
+            index = self._types[info.training_type] = _TypeIndex()
+        columns = index.columns
+        columns['distance'].append(info.distance)
+        columns['speed'].append(info.speed)
+        columns['calories'].append(info.calories)
+        columns['timestamp'].append(to_timestamp(moment))
+        index.messages.append(info)
+        index.pending += 1
+
+    def extend(
+            self,
+            messages: Iterable[homework.InfoMessage],
+            moments: Iterable[Moment],
+    ) -> None:
+        """Добавить пачку результатов."""
+
+        for info, moment in zip(messages, moments):
+            self.add(info, moment)
+
+    def __len__(self) -> int:
+        return sum(len(index.messages) for index in self._types.values())
+
+    def _index(self, training_type: str) -> Optional[_TypeIndex]:
+        index = self._types.get(training_type)
+        if index is not None:
+            index.flush()
+        return index
+
+    @staticmethod
+    def _span(
+            keys: List[Tuple[float, int]],
+            low: Optional[float],
+            high: Optional[float],
+    ) -> Tuple[int, int]:
+        start = 0 if low is None else bisect_left(keys, (low,))
+        end = len(keys) if high is None else bisect_left(keys, (high,))
+        return start, max(start, end)
+
+    def query(
+            self,
+            training_type: str,
+            **bounds: Bound,
+    ) -> List[homework.InfoMessage]:
+        """Найти результаты с ключами в полуинтервалах [low, high).
+
+        Например, `query('Running', calories=(500, None),
+        timestamp=(date(2024, 5, 1), date(2024, 6, 1)))`. Границы
+        `timestamp` принимают даты, время или POSIX-секунды, None
+        снимает ограничение. Диапазон берётся бинарным поиском по самому
+        узкому ключу, остальные условия проверяются на его строках.
+        Результаты идут в порядке добавления.
+        """
+
+        for key in bounds:
+            if key not in KEYS:
+                raise ValueError(f'Unknown index key: {key}')
+        index = self._index(training_type)
+        if index is None:
+            return []
+        if not bounds:
+            return list(index.messages)
+        spans = {}
+        for key, (low, high) in bounds.items():
+            if key == 'timestamp':
+                low = None if low is None else to_timestamp(low)
+                high = None if high is None else to_timestamp(high)
+            spans[key] = (low, high, self._span(index.sorted[key], low, high))
+        narrowest = min(
+            spans, key=lambda key: spans[key][2][1] - spans[key][2][0]
+        )
+        start, end = spans.pop(narrowest)[2]
+        rows = sorted(row for _, row in index.sorted[narrowest][start:end])
+        for key, (low, high, _) in spans.items():
+            column = index.columns[key]
+            rows = [
+                row for row in rows
+                if (low is None or column[row] >= low)
+                and (high is None or column[row] < high)
+            ]
+        return [index.messages[row] for row in rows]
+
+    def top(
+            self,
+            training_type: str,
+            key: str,
+            k: int,
+            largest: bool = True,
+    ) -> List[homework.InfoMessage]:
+        """Вернуть k результатов с наибольшим (или наименьшим) ключом."""
+
+        if key not in KEYS:
+            raise ValueError(f'Unknown index key: {key}')
+        index = self._index(training_type)
+        if index is None or k <= 0:
+            return []
+        keys = index.sorted[key]
+        chosen = reversed(keys[-k:]) if largest else keys[:k]
+        return [index.messages[row] for _, row in chosen]
@@ -0,0 +1,219 @@
+import json
+import random
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, Tuple
+
+import homework
+
+RESERVOIR_SIZE: int = 4096
+QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+
+_MISSING = object()
+_active: Optional['Profiler'] = None
+
+
+class StageStats:
+    """Счётчик вызовов этапа: число, суммарное время и выборка задержек.
+
+    Выборка ограничена `reservoir_size` значениями (reservoir sampling),
+    поэтому квантили приближённые, а память не растёт с числом вызовов.
+    """
+    __slots__ = ('count', 'total_ns', 'samples', 'reservoir_size', '_random')
+
+    def __init__(self, reservoir_size: int = RESERVOIR_SIZE) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.samples: List[int] = []
+        self.reservoir_size = reservoir_size
+        self._random = random.Random(0)
+
+    def record(self, elapsed_ns: int) -> None:
+        """Учесть один вызов."""
+
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if len(self.samples) < self.reservoir_size:
+            self.samples.append(elapsed_ns)
+        else:
+            index = self._random.randrange(self.count)
+            if index < self.reservoir_size:
+                self.samples[index] = elapsed_ns
+
+    def quantile(self, q: float) -> float:
+        """Вернуть квантиль задержки в наносекундах."""
+
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return float(ordered[min(int(q * len(ordered)), len(ordered) - 1)])
+
+
+def _first(args: tuple, kwargs: dict, name: str):
+    """Первый аргумент вызова, переданный по позиции или по имени."""
+
+    if args:
+        return args[0]
+    return kwargs.get(name, _MISSING)
+
+
+def _type_of_self(args: tuple, kwargs: dict) -> str:
+    value = _first(args, kwargs, 'self')
+    return '*' if value is _MISSING else type(value).__name__
+
+
+def _type_of_training(args: tuple, kwargs: dict) -> str:
+    value = _first(args, kwargs, 'training')
+    return '*' if value is _MISSING else type(value).__name__
+
+
+def _type_of_message(args: tuple, kwargs: dict) -> str:
+    value = _first(args, kwargs, 'self')
+    return getattr(value, 'training_type', '*')
+
+
+def _type_of_package(args: tuple, kwargs: dict) -> str:
+    value = _first(args, kwargs, 'workout_type')
+    return '*' if value is _MISSING else value
+
+
+def _any_type(args: tuple, kwargs: dict) -> str:
+    return '*'
+
+
+class Profiler:
+    """Счётчики времени по этапам расчёта и видам тренировок.
+
+    `enable()` подменяет функции и методы модуля `homework` обёртками
+    с замером времени, `disable()` возвращает исходные. В выключенном
+    состоянии код расчёта не меняется, поэтому накладных расходов нет.
+    Замеряются вызовы через атрибуты модуля и классов: ссылка на
+    `read_package`, сохранённая до `enable()`, идёт мимо счётчиков.
+    """
+
+    def __init__(self, reservoir_size: int = RESERVOIR_SIZE) -> None:
+        self.reservoir_size = reservoir_size
+        self.stats: Dict[Tuple[str, str], StageStats] = {}
+        self._patched: List[Tuple[object, str, object]] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Включены ли замеры."""
+
+        return bool(self._patched)
+
+    def _targets(self) -> List[Tuple[object, str, str, Callable]]:
+        """Перечислить подменяемые атрибуты: владелец, имя, этап, вид."""
+
+        targets = [
+            (homework, 'read_package', 'read_package', _type_of_package),
+            (homework, 'main', 'main', _type_of_training),
+            (homework, 'print', 'print', _any_type),
+            (homework.Training, 'show_training_info', 'show_training_info',
+             _type_of_self),
+            (homework.InfoMessage, 'get_message', 'get_message',
+             _type_of_message),
+        ]
+        for training_class in (homework.Training,
+                               *homework.TRAINING_TYPES.values()):
+            if 'get_spent_calories' in vars(training_class):
+                targets.append((training_class, 'get_spent_calories',
+                                'get_spent_calories', _type_of_self))
+        return targets
+
+    def _wrap(self, function: Callable, stage: str,
+              type_of: Callable) -> Callable:
+        stats = self.stats
+        reservoir_size = self.reservoir_size
+
+        @wraps(function)
+        def timed(*args, **kwargs):
+            started = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter_ns() - started
+                key = (stage, type_of(args, kwargs))
+                stage_stats = stats.get(key)
+                if stage_stats is None:
+                    stage_stats = stats[key] = StageStats(reservoir_size)
+                stage_stats.record(elapsed)
+        return timed
+
+    def enable(self) -> None:
+        """Включить замеры."""
+
+        global _active
+        if self.enabled:
+            return
+        if _active is not None:
+            raise RuntimeError('Another profiler is already enabled')
+        for owner, name, stage, type_of in self._targets():
+            original = vars(owner).get(name, _MISSING)
+            function = print if original is _MISSING else original
+            self._patched.append((owner, name, original))
+            setattr(owner, name, self._wrap(function, stage, type_of))
+        _active = self
+
+    def disable(self) -> None:
+        """Выключить замеры и вернуть исходные функции."""
+
+        global _active
+        for owner, name, original in reversed(self._patched):
+            if original is _MISSING:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._patched.clear()
+        if _active is self:
+            _active = None
+
+    def reset(self) -> None:
+        """Сбросить накопленные счётчики."""
+
+        self.stats.clear()
+
+    def __enter__(self) -> 'Profiler':
+        self.enable()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.disable()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Вернуть счётчики словарём: этап -> вид тренировки -> значения."""
+
+        report: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (stage, training_type), stats in sorted(self.stats.items()):
+            values = {
+                'count': stats.count,
+                'total_seconds': stats.total_ns / 1e9,
+            }
+            for q in QUANTILES:
+                values[f'p{q * 100:g}_seconds'] = stats.quantile(q) / 1e9
+            report.setdefault(stage, {})[training_type] = values
+        return report
+
+    def to_json(self) -> str:
+        """Выгрузить счётчики в JSON."""
+
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        """Выгрузить счётчики в текстовом формате Prometheus."""
+
+        name = 'workout_stage_seconds'
+        lines = [
+            f'# HELP {name} Latency of workout processing stages.',
+            f'# TYPE {name} summary',
+        ]
+        for (stage, training_type), stats in sorted(self.stats.items()):
+            labels = f'stage="{stage}",type="{training_type}"'
+            for q in QUANTILES:
+                lines.append(
+                    f'{name}{{{labels},quantile="{q:g}"}} '
+                    f'{stats.quantile(q) / 1e9:.9g}'
+                )
+            lines.append(f'{name}_sum{{{labels}}} {stats.total_ns / 1e9:.9g}')
+            lines.append(f'{name}_count{{{labels}}} {stats.count}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,191 @@
+import math
+import sys
+from typing import (IO, Callable, Dict, Iterable, Iterator, NamedTuple,
+                    Optional, Tuple, Type)
+
+import homework
+
+EMPTY = 'EMPTY'
+UNKNOWN_TYPE = 'UNKNOWN_TYPE'
+ARITY = 'ARITY'
+NOT_A_NUMBER = 'NOT_A_NUMBER'
+NOT_FINITE = 'NOT_FINITE'
+OUT_OF_RANGE = 'OUT_OF_RANGE'
+
+Range = Tuple[float, float]
+
+SECONDS_IN_HOUR: int = 3600
+FIELD_RANGES: Dict[str, Range] = {
+    'action': (0.0, 1e6),
+    'duration': (1 / SECONDS_IN_HOUR, 48.0),
+    'weight': (1.0, 500.0),
+    'height': (30.0, 300.0),
+    'length_pool': (1.0, 1000.0),
+    'count_pool': (0.0, 1e4),
+}
+DEFAULT_RANGE: Range = (0.0, sys.float_info.max)
+
+Packet = Tuple[str, Tuple[float, ...]]
+
+
+class PacketError(ValueError):
+    """Пакет датчиков не прошёл проверку."""
+
+    def __init__(self, reason: str, detail: str) -> None:
+        super().__init__(f'{reason}: {detail}')
+        self.reason = reason
+        self.detail = detail
+
+
+class Reject(NamedTuple):
+    """Отклонённая строка с кодом причины."""
+    line_number: int
+    line: bytes
+    reason: str
+    detail: str
+
+
+class PacketRule:
+    """Правило проверки пакетов одного вида тренировки.
+
+    Все значения должны быть конечными и лежать в границах
+    FIELD_RANGES (включительно); поле без границ — в DEFAULT_RANGE.
+    Границы отсекают значения, на которых формулы расчёта переполняются
+    или делят на почти ноль: длительность от секунды до двух суток,
+    вес от 1 до 500 кг, рост от 30 до 300 см и т. д.
+    """
+
+    def __init__(
+            self,
+            workout_type: str,
+            training_class: Type[homework.Training],
+    ) -> None:
+        self.workout_type = workout_type
+        self.training_class = training_class
+        self.fields: Tuple[str, ...] = homework.TRAINING_FIELDS[workout_type]
+        self.arity = len(self.fields)
+        self.ranges: Tuple[Range, ...] = tuple(
+            FIELD_RANGES.get(name, DEFAULT_RANGE) for name in self.fields
+        )
+
+    def in_range(self, values: Tuple[float, ...]) -> bool:
+        """Проверить, что все значения лежат в границах полей.
+
+        NaN не проходит ни одно сравнение, бесконечность — верхнюю
+        границу, поэтому отдельная проверка конечности не нужна.
+        """
+
+        for (low, high), value in zip(self.ranges, values):
+            if not low <= value <= high:
+                return False
+        return True
+
+    def parse(self, body: bytes) -> Tuple[float, ...]:
+        """Разобрать значения пакета, объясняя первую найденную ошибку."""
+
+        raw_values = body.split(b',') if body else []
+        if len(raw_values) != self.arity:
+            raise PacketError(
+                ARITY,
+                f'{self.workout_type} expects {self.arity} values, '
+                f'got {len(raw_values)}',
+            )
+        values = []
+        for name, (low, high), raw in zip(
+                self.fields, self.ranges, raw_values):
+            try:
+                value = float(raw)
+            except ValueError:
+                raise PacketError(NOT_A_NUMBER, f'{name}={raw!r}') from None
+            if not math.isfinite(value):
+                raise PacketError(NOT_FINITE, f'{name}={value}')
+            if not low <= value <= high:
+                raise PacketError(
+                    OUT_OF_RANGE, f'{name}={value}, need [{low:g}, {high:g}]'
+                )
+            values.append(value)
+        return tuple(values)
+
+
+RULES: Dict[bytes, PacketRule] = {
+    workout_type.encode('ascii'): PacketRule(workout_type, training_class)
+    for workout_type, training_class in homework.TRAINING_TYPES.items()
+}
+
+
+def parse_line(line: bytes) -> Packet:
+    """Разобрать и проверить строку `SWM,720,1,80,25,40`."""
+
+    line = line.strip()
+    if not line:
+        raise PacketError(EMPTY, 'empty line')
+    workout_type, _, body = line.partition(b',')
+    rule = RULES.get(workout_type)
+    if rule is None:
+        raise PacketError(UNKNOWN_TYPE, repr(workout_type))
+    return rule.workout_type, rule.parse(body)
+
+
+def parse_packets(
+        lines: Iterable[bytes],
+        rejects: Optional[Callable[[Reject], object]] = None,
+) -> Iterator[Packet]:
+    """Разобрать строки пакетов, отправляя отклонённые в `rejects`.
+
+    Корректная строка проходит одно разбиение и короткую проверку:
+    нет знака минус, значения в границах правила (`PacketRule.in_range`).
+    Построчный разбор с объяснением причины
+    запускается только для строк, не прошедших эту проверку.
+    Пустые строки пропускаются. Без `rejects` первая ошибка
+    поднимает PacketError.
+    """
+
+    get_rule = RULES.get
+    for line_number, line in enumerate(lines, 1):
+        code, *raw_values = line.split(b',')
+        rule = get_rule(code)
+        if (rule is not None and len(raw_values) == rule.arity
+                and b'-' not in line):
+            try:
+                values = tuple(map(float, raw_values))
+            except ValueError:
+                pass
+            else:
+                if rule.in_range(values):
+                    yield rule.workout_type, values
+                    continue
+        if line.isspace() or not line:
+            continue
+        try:
+            packet = parse_line(line)
+        except PacketError as error:
+            if rejects is None:
+                raise
+            rejects(Reject(
+                line_number, line.rstrip(b'\r\n'), error.reason, error.detail
+            ))
+            continue
+        yield packet
+
+
+def compute(packets: Iterable[Packet]) -> Iterator[homework.InfoMessage]:
+    """Рассчитать сообщения для проверенных пакетов.
+
+    Пакеты уже проверены, поэтому класс тренировки создаётся
+    напрямую, без повторной проверки в `read_package`.
+    """
+
+    training_types = homework.TRAINING_TYPES
+    for workout_type, values in packets:
+        yield training_types[workout_type](*values).show_training_info()
+
+
+def reject_writer(stream: IO[str]) -> Callable[[Reject], None]:
+    """Писать отклонённые строки в поток через табуляцию."""
+
+    def write(reject: Reject) -> None:
+        line = reject.line.decode('utf-8', 'backslashreplace')
+        stream.write(
+            f'{reject.line_number}\t{reject.reason}\t{reject.detail}\t{line}\n'
+        )
+    return write
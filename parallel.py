@@ -0,0 +1,161 @@
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import IO, Iterator, List, Optional, Sequence, Tuple
+
+import homework
+import pipeline
+
+SHARD_SIZE: int = 8 << 20
+MIN_SHARD_SIZE: int = 64 << 10
+SHARDS_PER_WORKER: int = 4
+
+Shard = Tuple[str, int, int]
+Failure = Tuple[int, str]
+
+
+def split_shards(path: str, shard_size: int = SHARD_SIZE) -> List[Shard]:
+    """Разбить файл на диапазоны байтов примерно одинакового размера."""
+
+    if shard_size <= 0:
+        raise ValueError(f'Shard size must be positive: {shard_size}')
+    size = os.path.getsize(path)
+    return [
+        (path, start, min(start + shard_size, size))
+        for start in range(0, size, shard_size)
+    ]
+
+
+def shard_size_for(size: int, workers: int) -> int:
+    """Подобрать размер диапазона: не меньше SHARDS_PER_WORKER на процесс.
+
+    Размер не больше SHARD_SIZE, чтобы память процесса не росла
+    с файлом, и не меньше MIN_SHARD_SIZE, чтобы накладные расходы
+    на задание не съели выигрыш.
+    """
+
+    shards = max(1, workers) * SHARDS_PER_WORKER
+    return max(MIN_SHARD_SIZE, min(SHARD_SIZE, -(-size // shards)))
+
+
+def _shard_lines(path: str, start: int, end: int) -> Iterator[str]:
+    """Отдать строки, первый байт которых лежит в диапазоне [start, end)."""
+
+    with open(path, 'rb') as stream:
+        position = start
+        if start:
+            stream.seek(start - 1)
+            position += len(stream.readline()) - 1
+        while position < end:
+            line = stream.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode('utf-8')
+
+
+def process_shard(shard: Shard) -> Tuple[str, int, Optional[Failure]]:
+    """Рассчитать сообщения для одного диапазона файла.
+
+    Вернуть текст сообщений, число строк диапазона и, если строка
+    оказалась ошибочной, её номер в диапазоне с описанием; текст
+    в этом случае содержит сообщения всех строк до неё.
+    """
+
+    lines = list(_shard_lines(*shard))
+    messages: List[homework.InfoMessage] = []
+    failure = None
+    try:
+        messages.extend(pipeline.compute_lines(lines))
+    except pipeline.LineError as error:
+        failure = (error.line_number, error.detail)
+    return homework.format_many(messages), len(lines), failure
+
+
+def run_parallel(
+        path: str,
+        destination: IO[str],
+        workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+) -> int:
+    """Рассчитать файл пакетов в пуле процессов, сохранив порядок строк.
+
+    Одновременно в работе держится не больше двух диапазонов на процесс,
+    поэтому память не растёт вместе с размером файла. Без `shard_size`
+    размер диапазона подбирается по размеру файла (`shard_size_for`),
+    чтобы работы хватило всем процессам. На ошибочной строке
+    поднимается pipeline.LineError с номером строки файла; сообщения
+    всех строк до неё уже записаны.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = shard_size_for(os.path.getsize(path), workers)
+    shards = iter(split_shards(path, shard_size))
+    written = 0
+    first_line = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            executor.submit(process_shard, shard)
+            for shard in islice(shards, workers * 2)
+        )
+        while pending:
+            output, lines, failure = pending.popleft().result()
+            destination.write(output)
+            written += output.count('\n')
+            if failure is not None:
+                for future in pending:
+                    future.cancel()
+                line_number, detail = failure
+                raise pipeline.LineError(first_line + line_number, detail)
+            first_line += lines
+            shard = next(shards, None)
+            if shard is not None:
+                pending.append(executor.submit(process_shard, shard))
+    return written
+
+
+def cli(argv: Optional[Sequence[str]] = None) -> int:
+    """Точка входа командной строки."""
+
+    parser = argparse.ArgumentParser(
+        description='Рассчитать тренировки из файла в несколько процессов.',
+    )
+    parser.add_argument('input', help='файл с пакетами')
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help='файл для сообщений, `-` — стандартный вывод',
+    )
+    parser.add_argument(
+        '-j', '--workers', type=int, default=None,
+        help='число процессов, по умолчанию — число ядер',
+    )
+    parser.add_argument(
+        '--shard-size', type=int, default=None,
+        help='размер диапазона файла для одного задания в байтах, '
+        'по умолчанию — по размеру файла и числу процессов',
+    )
+    args = parser.parse_args(argv)
+
+    destination = (
+        sys.stdout if args.output == '-'
+        else open(args.output, 'w', encoding='utf-8')
+    )
+    try:
+        run_parallel(args.input, destination, args.workers, args.shard_size)
+    except pipeline.LineError as error:
+        print(f'error: {error}', file=sys.stderr)
+        return 2
+    finally:
+        if destination is not sys.stdout:
+            destination.close()
+        else:
+            destination.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(cli())
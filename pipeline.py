@@ -0,0 +1,203 @@
+import argparse
+import sys
+from typing import IO, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import homework
+import packets
+
+CHUNK_SIZE: int = 1 << 20
+WRITE_BATCH: int = homework.WRITE_BATCH
+SEPARATOR: str = ','
+
+Packet = Tuple[str, List[float]]
+
+
+class LineError(ValueError):
+    """Строку пакета не удалось разобрать или рассчитать."""
+
+    def __init__(self, line_number: int, detail: str) -> None:
+        super().__init__(f'line {line_number}: {detail}')
+        self.line_number = line_number
+        self.detail = detail
+
+
+def read_lines(
+        stream: IO[str],
+        chunk_size: int = CHUNK_SIZE,
+) -> Iterator[str]:
+    """Читать поток кусками фиксированного размера и отдавать строки."""
+
+    tail = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (tail + chunk).split('\n')
+        tail = lines.pop()
+        yield from lines
+    if tail:
+        yield tail
+
+
+def parse_packet(line: str) -> Packet:
+    """Разобрать строку вида `SWM,720,1,80,25,40` в пакет датчиков."""
+
+    workout_type, *values = line.split(SEPARATOR)
+    return workout_type, [float(value) for value in values]
+
+
+def parse_packets(lines: Iterable[str]) -> Iterator[Packet]:
+    """Разобрать строки пакетов, пропуская пустые."""
+
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield parse_packet(line)
+
+
+def compute(packets: Iterable[Packet]) -> Iterator[homework.InfoMessage]:
+    """Рассчитать информационные сообщения для пакетов."""
+
+    read_package = homework.read_package
+    for workout_type, data in packets:
+        yield read_package(workout_type, data).show_training_info()
+
+
+def compute_lines(
+        lines: Iterable[str],
+) -> Iterator[homework.InfoMessage]:
+    """Разобрать и рассчитать строки пакетов, пропуская пустые.
+
+    Ошибка разбора или расчёта поднимается как LineError с номером
+    строки; сообщения предыдущих строк к этому моменту уже отданы.
+    """
+
+    read_package = homework.read_package
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            workout_type, data = parse_packet(line)
+            info = read_package(workout_type, data).show_training_info()
+        except (ValueError, ArithmeticError) as error:
+            raise LineError(line_number, str(error)) from error
+        yield info
+
+
+def run_pipeline(
+        source: IO[str],
+        destination: IO[str],
+        chunk_size: int = CHUNK_SIZE,
+        batch_size: int = WRITE_BATCH,
+) -> int:
+    """Прогнать поток пакетов через расчёт и записать сообщения.
+
+    На ошибочной строке поднимается LineError; сообщения всех строк
+    до неё уже записаны в `destination`.
+    """
+
+    lines = read_lines(source, chunk_size)
+    return homework.write_messages(
+        compute_lines(lines), destination, batch_size
+    )
+
+
+def run_validated(
+        source: IO[bytes],
+        destination: IO[str],
+        rejects: IO[str],
+        batch_size: int = WRITE_BATCH,
+) -> int:
+    """Прогнать поток с проверкой пакетов, отклонённые строки — в rejects."""
+
+    checked = packets.parse_packets(source, packets.reject_writer(rejects))
+    return homework.write_messages(
+        packets.compute(checked), destination, batch_size
+    )
+
+
+def cli(argv: Optional[Sequence[str]] = None) -> int:
+    """Точка входа командной строки."""
+
+    parser = argparse.ArgumentParser(
+        description='Рассчитать тренировки из файла пакетов датчиков.',
+    )
+    parser.add_argument(
+        'input', nargs='?', default='-',
+        help='файл с пакетами, `-` — стандартный ввод',
+    )
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help='файл для сообщений, `-` — стандартный вывод',
+    )
+    parser.add_argument(
+        '--chunk-size', type=int, default=CHUNK_SIZE,
+        help='размер блока чтения в символах',
+    )
+    parser.add_argument(
+        '--batch-size', type=int, default=WRITE_BATCH,
+        help='число строк в одной операции записи',
+    )
+    parser.add_argument(
+        '--rejects',
+        help='проверять пакеты и писать отклонённые строки в этот файл',
+    )
+    args = parser.parse_args(argv)
+    for option in ('chunk_size', 'batch_size'):
+        if getattr(args, option) < 1:
+            parser.error(f'--{option.replace("_", "-")} must be positive')
+    if args.rejects:
+        return _cli_validated(args)
+
+    source = (
+        sys.stdin if args.input == '-'
+        else open(args.input, encoding='utf-8')
+    )
+    destination = (
+        sys.stdout if args.output == '-'
+        else open(args.output, 'w', encoding='utf-8',
+                  buffering=args.chunk_size)
+    )
+    try:
+        run_pipeline(source, destination, args.chunk_size, args.batch_size)
+    except LineError as error:
+        print(f'error: {error}', file=sys.stderr)
+        return 2
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if destination is not sys.stdout:
+            destination.close()
+        else:
+            destination.flush()
+    return 0
+
+
+def _cli_validated(args: argparse.Namespace) -> int:
+    """Запуск командной строки с проверкой пакетов."""
+
+    source = (
+        sys.stdin.buffer if args.input == '-'
+        else open(args.input, 'rb', buffering=args.chunk_size)
+    )
+    destination = (
+        sys.stdout if args.output == '-'
+        else open(args.output, 'w', encoding='utf-8',
+                  buffering=args.chunk_size)
+    )
+    try:
+        with open(args.rejects, 'w', encoding='utf-8') as rejects:
+            run_validated(source, destination, rejects, args.batch_size)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if destination is not sys.stdout:
+            destination.close()
+        else:
+            destination.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(cli())
@@ -0,0 +1,263 @@
+import argparse
+import asyncio
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+import homework
+import pipeline
+
+BATCH_SIZE: int = 256
+BATCH_WINDOW: float = 0.002
+QUEUE_SIZE: int = 4096
+CONNECTION_WINDOW: int = 1024
+ERROR_PREFIX: str = 'ERROR: '
+
+Job = Tuple[str, 'asyncio.Future[str]']
+
+
+def compute_line(line: str) -> str:
+    """Рассчитать ответ на одну строку пакета или вернуть текст ошибки."""
+
+    try:
+        workout_type, data = pipeline.parse_packet(line)
+        training = homework.read_package(workout_type, data)
+        return training.show_training_info().get_message()
+    except (ValueError, TypeError, ArithmeticError) as error:
+        return f'{ERROR_PREFIX}{error}'
+
+
+class WorkoutServer:
+    """TCP-сервер: пакет в строке на входе, сообщение в строке на выходе.
+
+    Строки всех соединений собираются в пачки размером до `batch_size`
+    или за окно `batch_window` секунд. Очередь заданий ограничена
+    `queue_size`, очередь ответов соединения — `connection_window`:
+    при заполнении сервер перестаёт читать сокет клиента.
+    """
+
+    def __init__(
+            self,
+            batch_size: int = BATCH_SIZE,
+            batch_window: float = BATCH_WINDOW,
+            queue_size: int = QUEUE_SIZE,
+            connection_window: int = CONNECTION_WINDOW,
+    ) -> None:
+        for name, value in (('batch_size', batch_size),
+                            ('queue_size', queue_size),
+                            ('connection_window', connection_window)):
+            if value < 1:
+                raise ValueError(f'{name} must be positive: {value}')
+        if batch_window < 0:
+            raise ValueError(f'batch_window must be >= 0: {batch_window}')
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.queue_size = queue_size
+        self.connection_window = connection_window
+        self.processed = 0
+        self.batches = 0
+        self._jobs: Optional['asyncio.Queue[Job]'] = None
+        self._batcher: Optional['asyncio.Task[None]'] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        """Запустить приём соединений и обработчик пачек."""
+
+        self._jobs = asyncio.Queue(self.queue_size)
+        self._batcher = asyncio.create_task(self._run_batches())
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port
+        )
+
+    @property
+    def port(self) -> int:
+        """Порт, на котором слушает сервер."""
+
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Обслуживать соединения до остановки."""
+
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Остановить приём соединений и обработчик пачек."""
+
+        self._server.close()
+        await self._server.wait_closed()
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+
+    async def _collect_batch(self) -> List[Job]:
+        """Дождаться первого задания и добрать пачку в пределах окна."""
+
+        jobs = self._jobs
+        batch = [await jobs.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_window
+        while len(batch) < self.batch_size:
+            if not jobs.empty():
+                batch.append(jobs.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(jobs.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run_batches(self) -> None:
+        """Считать пачки заданий и отдавать результаты соединениям.
+
+        Непредвиденная ошибка расчёта строки завершает только её задание:
+        обработчик пачек продолжает работу для остальных соединений.
+        """
+
+        while True:
+            batch = await self._collect_batch()
+            for line, future in batch:
+                if future.done():
+                    continue
+                try:
+                    response = compute_line(line)
+                except Exception as error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(response)
+            self.processed += len(batch)
+            self.batches += 1
+
+    async def _handle_connection(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter,
+    ) -> None:
+        """Читать строки клиента и отправлять ответы в порядке запросов."""
+
+        pending: 'asyncio.Queue[Optional[asyncio.Future[str]]]' = (
+            asyncio.Queue(self.connection_window)
+        )
+        responder = asyncio.create_task(self._respond(pending, writer))
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode('utf-8', 'replace').strip()
+                if not line:
+                    continue
+                future = loop.create_future()
+                await pending.put(future)
+                await self._jobs.put((line, future))
+        except ConnectionError:
+            pass
+        finally:
+            await pending.put(None)
+            await responder
+
+    async def _respond(
+            self,
+            pending: 'asyncio.Queue[Optional[asyncio.Future[str]]]',
+            writer: asyncio.StreamWriter,
+    ) -> None:
+        """Писать ответы соединения по мере готовности, соблюдая порядок."""
+
+        lines: List[str] = []
+        try:
+            while True:
+                if lines and pending.empty():
+                    await self._flush(writer, lines)
+                future = await pending.get()
+                if future is None:
+                    break
+                if lines and not future.done():
+                    await self._flush(writer, lines)
+                lines.append(await self._response(future))
+            if lines:
+                await self._flush(writer, lines)
+        except ConnectionError:
+            while await pending.get() is not None:
+                pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _response(future: 'asyncio.Future[str]') -> str:
+        """Дождаться ответа, непредвиденную ошибку вернуть текстом."""
+
+        try:
+            return await future
+        except Exception as error:
+            return f'{ERROR_PREFIX}{error!r}'
+
+    @staticmethod
+    async def _flush(writer: asyncio.StreamWriter, lines: List[str]) -> None:
+        """Отправить накопленные ответы одной записью."""
+
+        writer.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        lines.clear()
+        await writer.drain()
+
+
+async def serve(host: str, port: int, **options) -> None:
+    """Запустить сервер и обслуживать соединения до прерывания."""
+
+    server = WorkoutServer(**options)
+    await server.start(host, port)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def cli(argv: Optional[Sequence[str]] = None) -> int:
+    """Точка входа командной строки."""
+
+    parser = argparse.ArgumentParser(
+        description='TCP-сервис расчёта тренировок по строкам пакетов.',
+    )
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument(
+        '--batch-size', type=int, default=BATCH_SIZE,
+        help='наибольшее число пакетов в пачке',
+    )
+    parser.add_argument(
+        '--batch-window', type=float, default=BATCH_WINDOW,
+        help='сколько секунд добирать пачку после первого пакета',
+    )
+    parser.add_argument(
+        '--queue-size', type=int, default=QUEUE_SIZE,
+        help='наибольшее число пакетов в очереди на расчёт',
+    )
+    parser.add_argument(
+        '--connection-window', type=int, default=CONNECTION_WINDOW,
+        help='наибольшее число неотправленных ответов соединения',
+    )
+    args = parser.parse_args(argv)
+    for option in ('batch_size', 'queue_size', 'connection_window'):
+        if getattr(args, option) < 1:
+            parser.error(f'--{option.replace("_", "-")} must be positive')
+    if args.batch_window < 0:
+        parser.error('--batch-window must not be negative')
+    try:
+        asyncio.run(serve(
+            args.host, args.port,
+            batch_size=args.batch_size,
+            batch_window=args.batch_window,
+            queue_size=args.queue_size,
+            connection_window=args.connection_window,
+        ))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(cli())
@@ -0,0 +1,127 @@
+from array import array
+from typing import Dict, Iterable, Iterator, Sequence, Tuple, Type
+
+from homework import TRAINING_FIELDS, TRAINING_TYPES, Training
+
+
+def _column_property(position: int) -> property:
+    """Создать свойство, читающее значение из колонки хранилища."""
+
+    def getter(self):
+        return self._columns[position][self._row]
+    return property(getter)
+
+
+def _view_init(self, columns: Tuple[array, ...], row: int) -> None:
+    self._columns = columns
+    self._row = row
+
+
+def make_view_class(
+        training_class: Type[Training],
+        fields: Tuple[str, ...],
+) -> Type[Training]:
+    """Создать класс-представление строки хранилища для вида тренировки.
+
+    Представление наследует все методы расчёта вида тренировки,
+    а параметры читает из колонок хранилища, не копируя их.
+    """
+
+    namespace = {
+        '__slots__': ('_columns', '_row'),
+        '__doc__': training_class.__doc__,
+        '__init__': _view_init,
+        'FIELDS': fields,
+    }
+    for position, name in enumerate(fields):
+        namespace[name] = _column_property(position)
+    return type(training_class.__name__, (training_class,), namespace)
+
+
+VIEW_CLASSES: Dict[str, Type[Training]] = {
+    workout_type: make_view_class(
+        training_class, TRAINING_FIELDS[workout_type]
+    )
+    for workout_type, training_class in TRAINING_TYPES.items()
+}
+
+
+class TrainingStore:
+    """Компактное хранилище тренировок: колонки `array` по коду тренировки.
+
+    Каждый параметр занимает 8 байт, порядок добавления — ещё 5 байт
+    на запись. Объекты тренировок создаются только при обращении.
+    """
+
+    def __init__(self) -> None:
+        self._codes: Tuple[str, ...] = tuple(VIEW_CLASSES)
+        self._columns: Dict[str, Tuple[array, ...]] = {
+            workout_type: tuple(array('d') for _ in view_class.FIELDS)
+            for workout_type, view_class in VIEW_CLASSES.items()
+        }
+        self._types = array('B')
+        self._rows = array('I')
+
+    def append(self, workout_type: str, data: Sequence[float]) -> int:
+        """Добавить пакет датчиков и вернуть номер записи.
+
+        Значения переводятся в float до записи в колонки, поэтому
+        ошибочный пакет не оставляет в хранилище частичной записи.
+        """
+
+        if workout_type not in self._columns:
+            raise ValueError(f'This key is not found: {workout_type}')
+        columns = self._columns[workout_type]
+        if len(data) != len(columns):
+            raise ValueError(
+                f'{workout_type} expects {len(columns)} values, '
+                f'got {len(data)}'
+            )
+        values = [float(value) for value in data]
+        row = len(columns[0])
+        for column, value in zip(columns, values):
+            column.append(value)
+        self._types.append(self._codes.index(workout_type))
+        self._rows.append(row)
+        return len(self._rows) - 1
+
+    def extend(self, packets: Iterable[Tuple[str, Sequence[float]]]) -> None:
+        """Добавить несколько пакетов датчиков."""
+
+        for workout_type, data in packets:
+            self.append(workout_type, data)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index: int) -> Training:
+        workout_type = self._codes[self._types[index]]
+        return VIEW_CLASSES[workout_type](
+            self._columns[workout_type], self._rows[index]
+        )
+
+    def __iter__(self) -> Iterator[Training]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def count(self, workout_type: str) -> int:
+        """Вернуть число записей данного вида тренировки."""
+
+        return len(self._columns[workout_type][0])
+
+    def views(self, workout_type: str) -> Iterator[Training]:
+        """Перебрать записи одного вида тренировки."""
+
+        view_class = VIEW_CLASSES[workout_type]
+        columns = self._columns[workout_type]
+        for row in range(len(columns[0])):
+            yield view_class(columns, row)
+
+    @property
+    def nbytes(self) -> int:
+        """Объём данных в колонках в байтах."""
+
+        arrays = [self._types, self._rows]
+        for columns in self._columns.values():
+            arrays.extend(columns)
+        return sum(column.itemsize * len(column) for column in arrays)
@@ -0,0 +1,56 @@
+from datetime import date, datetime
+
+import pytest
+
+import aggregates
+import homework
+
+
+def info(workout_type, data):
+    return homework.read_package(workout_type, data).show_training_info()
+
+
+def test_add_and_retract():
+    totals = aggregates.Aggregates('day')
+    running = info('RUN', [15000, 1, 75])
+    totals.add('anna', running, datetime(2021, 11, 1, 8, 30))
+    totals.add('anna', homework.Running(9000, 1, 75), date(2021, 11, 1))
+    day = totals.totals('anna', 'Running', date(2021, 11, 1))
+    assert day.count == 2
+    assert day.distance == running.distance + 5.85
+    totals.retract('anna', running, date(2021, 11, 1))
+    assert day.count == 1
+    assert day.calories == pytest.approx(info('RUN', [9000, 1, 75]).calories)
+    assert totals.totals('anna', 'Swimming', date(2021, 11, 1)).count == 0
+
+
+@pytest.mark.parametrize('granularity, moments, expected', [
+    ('week', [date(2021, 11, 1), date(2021, 11, 7), date(2021, 11, 8)], 2),
+    ('month', [date(2021, 11, 1), date(2021, 11, 30), date(2021, 12, 1)], 2),
+])
+def test_buckets(granularity, moments, expected):
+    totals = aggregates.Aggregates(granularity)
+    walking = info('WLK', [9000, 1, 75, 180])
+    for moment in moments:
+        totals.add(1, walking, moment)
+    assert totals.totals(1, 'SportsWalking', moments[0]).count == expected
+
+
+def test_sliding_window_expiry():
+    totals = aggregates.Aggregates('day', retention=2)
+    swimming = info('SWM', [720, 1, 80, 25, 40])
+    for day in (1, 2, 3):
+        totals.add('anna', swimming, date(2021, 11, day))
+    assert totals.window('anna', 'Swimming').count == 3
+    assert totals.expire(date(2021, 11, 3)) == 1
+    window = totals.window('anna', 'Swimming')
+    assert window.count == 2
+    assert window.calories == 2 * swimming.calories
+    assert totals.totals('anna', 'Swimming', date(2021, 11, 1)).count == 0
+    totals.add('anna', swimming, date(2021, 11, 1))
+    assert window.count == 2, 'Устаревшие тренировки не должны учитываться.'
+
+
+def test_unknown_granularity():
+    with pytest.raises(ValueError):
+        aggregates.Aggregates('year')
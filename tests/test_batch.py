@@ -0,0 +1,60 @@
+import pytest
+
+import homework
+from workload import Workload
+
+np = pytest.importorskip('numpy')
+batch = pytest.importorskip('batch')
+
+
+# Шире диапазонов по умолчанию: нулевые дистанции и долгие тренировки.
+RANGES = {
+    code: {'action': (0, 40000), 'duration': (0.1, 5.0)}
+    for code in ('SWM', 'RUN', 'WLK')
+}
+
+
+def to_columns(packages):
+    padded = [data + [1] * (5 - len(data)) for _, data in packages]
+    actions, durations, weights = [], [], []
+    heights, length_pools, count_pools = [], [], []
+    for (workout_type, data), row in zip(packages, padded):
+        actions.append(row[0])
+        durations.append(row[1])
+        weights.append(row[2])
+        heights.append(row[3] if workout_type == 'WLK' else 1)
+        length_pools.append(row[3] if workout_type == 'SWM' else 1)
+        count_pools.append(row[4] if workout_type == 'SWM' else 1)
+    return ([workout_type for workout_type, _ in packages], actions,
+            durations, weights, heights, length_pools, count_pools)
+
+
+def test_compute_batch_matches_scalar_classes():
+    packages = list(Workload(seed=0, ranges=RANGES).packages(5000))
+    distance, speed, calories = batch.compute_batch(*to_columns(packages))
+    for index, (workout_type, data) in enumerate(packages):
+        training = homework.read_package(workout_type, data)
+        assert distance[index] == training.get_distance(), (
+            'Дистанция в пакетном расчёте должна совпадать до бита.'
+        )
+        assert speed[index] == training.get_mean_speed(), (
+            'Скорость в пакетном расчёте должна совпадать до бита.'
+        )
+        assert calories[index] == training.get_spent_calories(), (
+            'Калории в пакетном расчёте должны совпадать до бита.'
+        )
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    (('WLK', [9000, 1, 75, 180]), 157.50000000000003),
+    (('RUN', [1206, 12, 6]), -81.32032799999999),
+    (('SWM', [720, 1, 80, 25, 40]), 336.0),
+])
+def test_compute_batch_known_values(input_data, expected):
+    _, _, calories = batch.compute_batch(*to_columns([input_data]))
+    assert calories[0] == expected
+
+
+def test_compute_batch_unknown_type():
+    with pytest.raises(ValueError):
+        batch.compute_batch(['XXX'], [1], [1], [1], [1], [1], [1])
@@ -0,0 +1,80 @@
+import pytest
+
+import binary
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [1206, 12, 6]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+@pytest.fixture
+def messages():
+    return [
+        homework.read_package(*package).show_training_info()
+        for package in PACKAGES
+    ] * 3
+
+
+@pytest.fixture
+def results_file(tmp_path, messages):
+    path = str(tmp_path / 'results.bin')
+    with binary.ResultWriter.open(path) as writer:
+        writer.write(messages[0])
+        writer.write_many(messages[1:])
+    return path
+
+
+def test_iter_results_roundtrip(results_file, messages):
+    assert list(binary.iter_results(results_file)) == messages, (
+        'Значения должны читаться без потери точности.'
+    )
+
+
+def test_read_results_numpy_views(results_file, messages):
+    np = pytest.importorskip('numpy')
+    records = binary.read_results(results_file)
+    assert len(records) == len(messages)
+    calories = records['calories']
+    assert isinstance(records, np.memmap)
+    assert np.shares_memory(calories, records)
+    assert calories.tolist() == [message.calories for message in messages]
+    assert [binary.TYPE_NAMES[code] for code in records['type']] == [
+        message.training_type for message in messages
+    ]
+
+
+def test_partial_record_ignored(results_file, messages):
+    with open(results_file, 'ab') as stream:
+        stream.write(b'\x01\x02')
+    assert len(list(binary.iter_results(results_file))) == len(messages)
+
+
+def test_empty_and_bad_files(tmp_path):
+    path = str(tmp_path / 'empty.bin')
+    binary.ResultWriter.open(path).close()
+    assert list(binary.iter_results(path)) == []
+    (tmp_path / 'bad.bin').write_bytes(b'not a results file')
+    with pytest.raises(ValueError):
+        list(binary.iter_results(str(tmp_path / 'bad.bin')))
+
+
+def test_new_type_gets_code(tmp_path):
+    info = homework.InfoMessage('Cycling', 1.0, 20.0, 20.0, 500.0)
+    path = str(tmp_path / 'results.bin')
+    with binary.ResultWriter.open(path) as writer:
+        with pytest.raises(ValueError, match='add_type_name'):
+            writer.write(info)
+    code = binary.add_type_name('Cycling')
+    try:
+        assert code == len(binary.TYPE_NAMES) - 1
+        assert binary.add_type_name('Cycling') == code, (
+            'Повторная регистрация должна возвращать прежний код.'
+        )
+        with binary.ResultWriter.open(path) as writer:
+            writer.write(info)
+        assert list(binary.iter_results(path)) == [info]
+    finally:
+        del binary.TYPE_CODES[binary.TYPE_NAMES.pop()]
@@ -0,0 +1,36 @@
+import pytest
+
+import cache
+import homework
+
+
+def test_cached_message_matches_main():
+    package_cache = cache.PackageCache()
+    training = homework.read_package('SWM', [720, 1, 80, 25, 40])
+    expected = training.show_training_info().get_message()
+    assert package_cache.get_message('SWM', [720, 1, 80, 25, 40]) == expected
+    assert package_cache.get_message('SWM', (720, 1, 80, 25, 40)) == expected
+    assert package_cache.stats() == {
+        'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 65536,
+    }
+
+
+def test_lru_eviction():
+    package_cache = cache.PackageCache(maxsize=2)
+    package_cache.get_info('RUN', [1000, 1, 70])
+    package_cache.get_info('RUN', [2000, 1, 70])
+    package_cache.get_info('RUN', [1000, 1, 70])
+    package_cache.get_info('RUN', [3000, 1, 70])
+    assert package_cache.evictions == 1
+    assert len(package_cache) == 2
+    package_cache.get_info('RUN', [1000, 1, 70])
+    assert package_cache.hits == 2, (
+        'Вытесняться должна запись, которую дольше всех не запрашивали.'
+    )
+    package_cache.get_info('RUN', [2000, 1, 70])
+    assert package_cache.misses == 4
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        cache.PackageCache(maxsize=0)
@@ -0,0 +1,54 @@
+import pytest
+
+import homework
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+]
+
+
+@pytest.mark.parametrize('workout_type, data', PACKAGES)
+def test_cached_class_matches_plain(workout_type, data):
+    plain = homework.read_package(workout_type, data)
+    cached_class = homework.with_cached_metrics(type(plain))
+    cached = cached_class(*data)
+    assert isinstance(cached, type(plain))
+    assert cached_class is homework.with_cached_metrics(type(plain))
+    for _ in range(2):
+        assert (
+            cached.show_training_info() == plain.show_training_info()
+        ), 'Кешированные метрики должны совпадать с обычным расчётом.'
+
+
+def test_cached_metrics_are_computed_once(monkeypatch):
+    cached = homework.with_cached_metrics(homework.Running)(15000, 1, 75)
+    calls = []
+    original = homework.Training.get_distance
+
+    def counting_distance(self):
+        calls.append(self)
+        return original(self)
+    monkeypatch.setattr(homework.Training, 'get_distance', counting_distance)
+    cached.show_training_info()
+    cached.show_training_info()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize('workout_type, data, name, value', [
+    ('RUN', [15000, 1, 75], 'action', 9000),
+    ('RUN', [15000, 1, 75], 'duration', 2),
+    ('RUN', [15000, 1, 75], 'weight', 60),
+    ('WLK', [9000, 1, 75, 180], 'height', 150),
+    ('SWM', [720, 1, 80, 25, 40], 'count_pool', 20),
+])
+def test_cache_invalidated_on_change(workout_type, data, name, value):
+    plain = homework.read_package(workout_type, data)
+    cached = homework.with_cached_metrics(type(plain))(*data)
+    cached.show_training_info()
+    setattr(plain, name, value)
+    setattr(cached, name, value)
+    assert cached.show_training_info() == plain.show_training_info(), (
+        'Кеш должен сбрасываться при изменении параметров тренировки.'
+    )
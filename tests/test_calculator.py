@@ -0,0 +1,128 @@
+import random
+import threading
+from io import StringIO
+
+import pytest
+
+import calculator
+import homework
+from workload import Workload
+
+THREADS = 8
+CALLS = 2000
+
+
+def run_threads(target, count):
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def worker(number):
+        barrier.wait()
+        try:
+            target(number)
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=worker, args=(number,))
+        for number in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+
+
+def expected_message(package):
+    return homework.read_package(*package).show_training_info().get_message()
+
+
+def test_concurrent_results_match_single_thread():
+    packages = list(Workload(seed=0).packages(300))
+    expected = [expected_message(package) for package in packages]
+    shared = calculator.Calculator(maxsize=128, shards=4)
+    mismatches = []
+
+    def work(number):
+        rnd = random.Random(number)
+        for _ in range(CALLS):
+            index = rnd.randrange(len(packages))
+            if shared.message(*packages[index]) != expected[index]:
+                mismatches.append(index)
+
+    run_threads(work, THREADS)
+    assert not mismatches, (
+        'Результаты в потоках должны совпадать с однопоточным расчётом.'
+    )
+    stats = shared.stats()
+    assert stats['requests'] == THREADS * CALLS, (
+        'Счётчики потоков должны складываться без потерь.'
+    )
+    assert stats['hits'] + stats['misses'] == stats['requests']
+    assert stats['size'] <= stats['maxsize'] == 128
+
+
+def test_concurrent_writes_do_not_interleave():
+    packages = list(Workload(seed=0).packages(50))
+    expected = {expected_message(package) for package in packages}
+    shared = calculator.Calculator()
+    sink = StringIO()
+
+    def work(number):
+        for start in range(0, len(packages), 7):
+            shared.write(packages[start:start + 7], sink)
+
+    run_threads(work, THREADS)
+    lines = sink.getvalue().splitlines()
+    assert len(lines) == THREADS * len(packages)
+    assert set(lines) == expected, (
+        'Строки разных потоков не должны перемешиваться.'
+    )
+    stats = shared.stats()
+    assert stats['lines'] == len(lines)
+    assert stats['writes'] == THREADS * 8
+
+
+def test_errors_are_counted_and_raised():
+    shared = calculator.Calculator()
+    with pytest.raises(ValueError):
+        shared.info('XXX', [1, 2, 3])
+    assert shared.info('RUN', [15000, 1, 75]) == homework.read_package(
+        'RUN', [15000, 1, 75]
+    ).show_training_info()
+    with pytest.raises(OverflowError):
+        shared.info('WLK', [1e203, 1, 75, 180])
+    stats = shared.stats()
+    assert (stats['requests'], stats['errors']) == (3, 2), (
+        'Переполнение должно учитываться как ошибка.'
+    )
+
+
+def test_counters_survive_finished_threads():
+    counters = calculator.ThreadCounters()
+
+    def work(number):
+        counters.table()['requests'] += number + 1
+
+    run_threads(work, 4)
+    counters.table()['errors'] += 1
+    assert counters.snapshot() == {
+        'requests': 10, 'errors': 1, 'writes': 0, 'lines': 0,
+    }
+
+
+def test_finished_threads_release_their_tables():
+    counters = calculator.ThreadCounters()
+
+    def work(number):
+        counters.table()['lines'] += 1
+
+    for _ in range(50):
+        thread = threading.Thread(target=work, args=(0,))
+        thread.start()
+        thread.join()
+    assert counters.snapshot()['lines'] == 50
+    assert len(counters._tables) == 0, (
+        'Словари завершившихся потоков не должны накапливаться.'
+    )
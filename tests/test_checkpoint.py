@@ -0,0 +1,149 @@
+import gzip
+
+import pytest
+
+import checkpoint
+import homework
+import packets
+from workload import Workload
+
+LINES = 1000
+EVERY = 128
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'packets.txt'
+    with open(path, 'wb') as stream:
+        Workload(seed=11).write(stream, LINES, pool_size=0)
+    return str(path)
+
+
+def expected_output(source):
+    with open(source, encoding='utf-8') as stream:
+        packages = [line.strip().split(',') for line in stream]
+    return ''.join(
+        homework.read_package(code, [float(value) for value in values])
+        .show_training_info().get_message() + '\n'
+        for code, *values in packages
+    )
+
+
+def read_output(path, compression):
+    with checkpoint.OPENERS[compression](path, 'rb') as stream:
+        return stream.read().decode()
+
+
+@pytest.mark.parametrize('compression', sorted(checkpoint.COMPRESSORS))
+def test_resume_after_crash(tmp_path, source, compression, monkeypatch):
+    output = str(tmp_path / 'out')
+    save = checkpoint.save_checkpoint
+    calls = []
+
+    def crashing_save(path, state):
+        calls.append(state)
+        if len(calls) == 3:
+            raise OSError('disk went away')
+        save(path, state)
+
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', crashing_save)
+    with pytest.raises(OSError):
+        checkpoint.run_checkpointed(
+            source, output, every=EVERY, compression=compression
+        )
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', save)
+    with open(output, 'ab') as stream:
+        stream.write(b'torn write')
+
+    processed = checkpoint.run_checkpointed(
+        source, output, every=EVERY, compression=compression
+    )
+    assert processed == LINES - 2 * EVERY, (
+        'Продолжение должно начинаться с последней контрольной точки.'
+    )
+    assert read_output(output, compression) == expected_output(source), (
+        'После продолжения вывод должен совпадать с непрерывным запуском.'
+    )
+
+
+def test_complete_run_is_not_repeated(tmp_path, source):
+    output = str(tmp_path / 'out.gz')
+    assert checkpoint.run_checkpointed(source, output, every=EVERY) == LINES
+    state = checkpoint.load_checkpoint(output + '.checkpoint')
+    assert state.complete and state.compression == 'gzip'
+    assert state.lines == LINES
+    assert checkpoint.run_checkpointed(source, output, every=EVERY) == 0
+    assert checkpoint.run_checkpointed(
+        source, output, every=EVERY, restart=True
+    ) == LINES
+    assert read_output(output, 'gzip') == expected_output(source)
+
+
+def test_compressed_input(tmp_path, source):
+    archive = str(tmp_path / 'packets.txt.gz')
+    with open(source, 'rb') as plain, gzip.open(archive, 'wb') as packed:
+        packed.write(plain.read())
+    output = str(tmp_path / 'out.txt')
+    checkpoint.run_checkpointed(archive, output, every=EVERY)
+    with open(output, encoding='utf-8') as stream:
+        assert stream.read() == expected_output(source)
+
+
+def test_checkpoint_mismatch(tmp_path, source):
+    output = str(tmp_path / 'out')
+    checkpoint.run_checkpointed(source, output, every=EVERY)
+    with pytest.raises(ValueError):
+        checkpoint.run_checkpointed(
+            source, output, every=EVERY, compression='gzip'
+        )
+
+
+def test_bad_lines_go_to_reject_log(tmp_path, monkeypatch):
+    source = tmp_path / 'packets.txt'
+    source.write_text(
+        'RUN,15000,1,75\nRUN,1,2\n\nWLK,1e203,1,75,180\n'
+        'SWM,720,1,80,25,40\nXXX,1\n'
+    )
+    output = str(tmp_path / 'out')
+    save = checkpoint.save_checkpoint
+    calls = []
+
+    def crashing_save(path, state):
+        calls.append(state)
+        if len(calls) == 2:
+            raise OSError('disk went away')
+        save(path, state)
+
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', crashing_save)
+    with pytest.raises(OSError):
+        checkpoint.run_checkpointed(str(source), output, every=3)
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', save)
+    assert checkpoint.run_checkpointed(str(source), output, every=3) == 3, (
+        'Плохие строки не должны мешать продолжению.'
+    )
+    with open(output + '.rejects', encoding='utf-8') as stream:
+        rejects = [line.split('\t')[:2] for line in stream]
+    assert rejects == [
+        ['2', packets.ARITY], ['4', packets.OUT_OF_RANGE],
+        ['6', packets.UNKNOWN_TYPE],
+    ], 'Журнал должен содержать номера строк файла без повторов.'
+    assert checkpoint.load_checkpoint(output + '.checkpoint').rejected == 3
+    with open(output, encoding='utf-8') as stream:
+        assert len(stream.read().splitlines()) == 2
+
+
+def test_resume_without_destination(tmp_path, source, monkeypatch, capsys):
+    output = str(tmp_path / 'out')
+    save = checkpoint.save_checkpoint
+
+    def crashing_save(path, state):
+        save(path, state)
+        raise OSError('disk went away')
+
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', crashing_save)
+    with pytest.raises(OSError):
+        checkpoint.run_checkpointed(source, output, every=EVERY)
+    monkeypatch.setattr(checkpoint, 'save_checkpoint', save)
+    (tmp_path / 'out').unlink()
+    assert checkpoint.cli([source, output, '--every', str(EVERY)]) == 1
+    assert capsys.readouterr().err.startswith('error:')
@@ -0,0 +1,86 @@
+import subprocess
+import sys
+from io import StringIO
+
+import pytest
+
+import homework
+from conftest import BASE_DIR, Capturing
+
+
+def expected_output(packages):
+    with Capturing() as output:
+        for package in packages:
+            homework.main(homework.read_package(*package))
+    return output
+
+
+def test_cli_without_arguments_prints_demo():
+    with Capturing() as output:
+        assert homework.cli([]) == 0
+    assert output == expected_output(homework.DEMO_PACKAGES), (
+        'Без аргументов CLI должен считать примеры из задания.'
+    )
+
+
+def test_cli_arguments_and_stdin(monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', StringIO('WLK,9000,1,75,180\n\n'))
+    with Capturing() as output:
+        assert homework.cli(['RUN,15000,1,75', '-']) == 0
+    assert output == expected_output([
+        ('RUN', [15000, 1, 75]), ('WLK', [9000, 1, 75, 180]),
+    ])
+
+
+@pytest.mark.parametrize('packet', [
+    'XXX,1,2', 'RUN,1,2', 'RUN,1,2,x', 'RUN,15000,0,75', 'WLK,9000,1,75,0',
+    'WLK,1e203,1,75,180',
+])
+def test_cli_bad_packet(packet, capsys):
+    assert homework.cli([packet]) == 2, (
+        'Ошибочный пакет должен давать код возврата 2.'
+    )
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert captured.err.startswith('error:')
+
+
+@pytest.mark.parametrize('packet', ['RUN,15000,0,75', 'WLK,9000,1,75,0'])
+def test_cli_batch_rejects_zero_divisor(packet, capsys):
+    pytest.importorskip('numpy')
+    with pytest.raises(SystemExit) as error:
+        homework.cli(['--batch', packet])
+    assert error.value.code == 2, (
+        'Векторный расчёт должен отклонять пакет, как и построчный.'
+    )
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'error:' in captured.err
+
+
+@pytest.mark.parametrize('packet', [
+    'RUN,15000,-1,75', 'WLK,9000,1,75,-180', 'SWM,720,-2,80,25,40',
+])
+def test_cli_paths_agree_on_negative_values(packet, capsys):
+    pytest.importorskip('numpy')
+    scalar_code = homework.cli([packet])
+    scalar = capsys.readouterr()
+    batch_code = homework.cli(['--batch', packet])
+    batched = capsys.readouterr()
+    assert (scalar_code, scalar.out) == (batch_code, batched.out), (
+        'Оба пути CLI должны одинаково обрабатывать отрицательные значения.'
+    )
+
+
+def test_cli_imports_heavy_modules_lazily():
+    code = (
+        'import sys, homework; homework.cli(["RUN,15000,1,75"]); '
+        'print(sorted({"argparse", "numpy", "batch"} & set(sys.modules)))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=BASE_DIR,
+        capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.splitlines()[-1] == '[]', (
+        'Короткий запуск не должен импортировать argparse и NumPy.'
+    )
@@ -0,0 +1,37 @@
+import random
+from dataclasses import asdict
+
+import pytest
+
+import homework
+
+
+def random_messages(count, seed=0):
+    rnd = random.Random(seed)
+    return [
+        homework.InfoMessage(
+            rnd.choice(['Swimming', 'Running', 'SportsWalking']),
+            *(rnd.uniform(-1e6, 1e6) for _ in range(4)),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_get_message_matches_template():
+    for message in random_messages(10000):
+        assert message.get_message() == (
+            message.MESSAGE.format(**asdict(message))
+        ), 'Сообщение должно совпадать с шаблоном `MESSAGE` побайтно.'
+
+
+def test_info_message_is_slotted():
+    message = homework.InfoMessage('Running', 1, 2, 3, 4)
+    assert not hasattr(message, '__dict__')
+
+
+@pytest.mark.parametrize('count', [0, 1, 100])
+def test_format_many(count):
+    messages = random_messages(count, seed=count)
+    assert homework.format_many(messages) == ''.join(
+        message.get_message() + '\n' for message in messages
+    )
@@ -0,0 +1,56 @@
+import pytest
+
+import homework
+
+PACKAGES = {
+    'RUN': (15000, 1, 75),
+    'WLK': (9000, 1, 75, 180),
+    'SWM': (720, 1, 80, 25, 40),
+}
+
+
+@pytest.mark.parametrize('workout_type, helper', [
+    ('RUN', 'get_distance'),
+    ('RUN', 'get_mean_speed'),
+    ('RUN', 'get_duration_in_minutes'),
+    ('WLK', 'get_distance'),
+    ('WLK', 'get_mean_speed'),
+    ('WLK', 'get_duration_in_minutes'),
+])
+def test_overridden_helper_changes_calories(workout_type, helper):
+    training_class = homework.TRAINING_TYPES[workout_type]
+    subclass = type('Custom', (training_class,), {
+        helper: lambda self: 50.0,
+    })
+    data = PACKAGES[workout_type]
+    assert subclass(*data).get_spent_calories() != (
+        training_class(*data).get_spent_calories()
+    ), 'Расчёт калорий должен вызывать переопределённый помощник.'
+
+
+def test_running_with_fixed_distance():
+    class FixedDistance(homework.Running):
+        def get_distance(self):
+            return 10.0
+
+    assert FixedDistance(15000, 1, 75).get_spent_calories() == 720.0
+
+
+@pytest.mark.parametrize('name, value, expected', [
+    ('CALORIES_AGE_FACTOR', 25, 677.25),
+    ('get_mean_speed', lambda self: 100.0, 8010.0),
+])
+def test_runtime_class_changes_are_honoured(monkeypatch, name, value,
+                                            expected):
+    monkeypatch.setattr(homework.Running, name, value)
+    assert homework.Running(15000, 1, 75).get_spent_calories() == expected, (
+        'Изменение класса во время работы должно влиять на расчёт.'
+    )
+
+
+def test_subclasses_share_calorie_method():
+    class SlowRunning(homework.Running):
+        CALORIES_AGE_FACTOR = 25
+
+    assert 'get_spent_calories' not in vars(SlowRunning)
+    assert SlowRunning(15000, 1, 75).get_spent_calories() == 677.25
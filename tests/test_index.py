@@ -0,0 +1,86 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import homework
+import index
+from workload import Workload
+
+START = datetime(2024, 1, 1)
+
+
+def make_results(count, seed=0):
+    return [
+        (homework.read_package(*package).show_training_info(),
+         START + timedelta(hours=number))
+        for number, package in enumerate(Workload(seed).packages(count))
+    ]
+
+
+def scan(results, training_type, **bounds):
+    found = []
+    for info, moment in results:
+        values = {
+            'distance': info.distance, 'speed': info.speed,
+            'calories': info.calories,
+            'timestamp': index.to_timestamp(moment),
+        }
+        if info.training_type == training_type and all(
+            (low is None or values[key] >= index.to_timestamp(low))
+            and (high is None or values[key] < index.to_timestamp(high))
+            for key, (low, high) in bounds.items()
+        ):
+            found.append(info)
+    return found
+
+
+@pytest.fixture
+def results():
+    return make_results(3000)
+
+
+@pytest.mark.parametrize('training_type, bounds', [
+    ('Running', {'calories': (500, None)}),
+    ('Running', {
+        'calories': (500, None),
+        'timestamp': (date(2024, 1, 20), date(2024, 2, 20)),
+    }),
+    ('Swimming', {'speed': (1.0, 2.0), 'distance': (None, 2.0)}),
+    ('SportsWalking', {'timestamp': (START, START + timedelta(days=3))}),
+    ('Swimming', {'calories': (10_000, None)}),
+    ('Unknown', {'calories': (0, None)}),
+])
+def test_query_matches_scan(results, training_type, bounds):
+    workouts = index.WorkoutIndex()
+    half = len(results) // 2
+    for info, moment in results[:half]:
+        workouts.add(info, moment)
+    workouts.query('Running', calories=(0, None))
+    workouts.extend(*zip(*results[half:]))
+    assert len(workouts) == len(results)
+    assert workouts.query(training_type, **bounds) == scan(
+        results, training_type, **bounds
+    ), 'Запрос по индексу должен совпадать с полным перебором.'
+
+
+def test_top(results):
+    workouts = index.WorkoutIndex()
+    workouts.extend(*zip(*results))
+    swims = [info for info, _ in results if info.training_type == 'Swimming']
+    fastest = workouts.top('Swimming', 'speed', 5)
+    assert [info.speed for info in fastest] == sorted(
+        (info.speed for info in swims), reverse=True
+    )[:5], 'top должен возвращать самые быстрые заплывы по убыванию.'
+    slowest = workouts.top('Swimming', 'speed', 3, largest=False)
+    assert [info.speed for info in slowest] == sorted(
+        info.speed for info in swims
+    )[:3]
+    assert workouts.top('Swimming', 'speed', 0) == []
+
+
+def test_unknown_key():
+    workouts = index.WorkoutIndex()
+    with pytest.raises(ValueError):
+        workouts.query('Running', pace=(1, 2))
+    with pytest.raises(ValueError):
+        workouts.top('Running', 'pace', 1)
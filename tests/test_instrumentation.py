@@ -0,0 +1,97 @@
+import json
+from io import StringIO
+
+import pytest
+
+import homework
+import instrumentation
+import pipeline
+from conftest import Capturing
+
+PACKETS = 'SWM,720,1,80,25,40\nRUN,15000,1,75\nWLK,9000,1,75,180\n' * 4
+
+
+@pytest.fixture
+def profiler():
+    profiler = instrumentation.Profiler(reservoir_size=5)
+    yield profiler
+    profiler.disable()
+
+
+def test_disabled_profiler_restores_originals(profiler):
+    originals = (
+        homework.read_package, homework.main,
+        homework.Running.get_spent_calories, homework.InfoMessage.get_message,
+    )
+    profiler.enable()
+    assert homework.read_package is not originals[0]
+    profiler.disable()
+    assert (
+        homework.read_package, homework.main,
+        homework.Running.get_spent_calories, homework.InfoMessage.get_message,
+    ) == originals, 'Выключенный профилировщик не должен оставлять обёрток.'
+    assert 'print' not in vars(homework)
+
+
+def test_stage_counters(profiler):
+    with profiler:
+        pipeline.run_pipeline(StringIO(PACKETS), StringIO())
+        with Capturing() as output:
+            homework.main(homework.read_package('RUN', [15000, 1, 75]))
+    assert len(output) == 1
+    report = profiler.snapshot()
+    assert report['read_package']['SWM']['count'] == 4
+    assert report['read_package']['RUN']['count'] == 5
+    assert report['get_spent_calories']['SportsWalking']['count'] == 4
+    assert report['show_training_info']['Running']['count'] == 5
+    assert report['get_message']['Running']['count'] == 1
+    assert report['main']['Running']['count'] == 1
+    assert report['print']['*']['count'] == 1
+    stats = report['show_training_info']['Swimming']
+    assert 0 < stats['p50_seconds'] <= stats['total_seconds']
+
+
+def test_exports(profiler):
+    with profiler:
+        homework.read_package('RUN', [15000, 1, 75]).show_training_info()
+    assert json.loads(profiler.to_json()) == profiler.snapshot()
+    text = profiler.to_prometheus()
+    assert (
+        'workout_stage_seconds_count{stage="read_package",type="RUN"} 1'
+        in text.splitlines()
+    )
+
+
+def test_single_active_profiler(profiler):
+    with profiler:
+        with pytest.raises(RuntimeError):
+            instrumentation.Profiler().enable()
+
+
+def test_keyword_calls_are_transparent(profiler):
+    with profiler:
+        training = homework.read_package(
+            workout_type='RUN', data=[15000, 1, 75]
+        )
+        with Capturing() as output:
+            homework.main(training=training)
+    assert len(output) == 1, 'Вызов по именам должен работать как без замеров.'
+    report = profiler.snapshot()
+    assert report['read_package']['RUN']['count'] == 1
+    assert report['main']['Running']['count'] == 1
+
+
+def test_store_views_are_timed(profiler):
+    import store
+
+    training_store = store.TrainingStore()
+    training_store.append('RUN', [15000, 1, 75])
+    with profiler:
+        for view in training_store:
+            view.show_training_info()
+        homework.read_package('RUN', [15000, 1, 75]).show_training_info()
+    report = profiler.snapshot()
+    assert report['show_training_info']['Running']['count'] == 2
+    assert report['get_spent_calories']['Running']['count'] == 2, (
+        'Калории представлений хранилища должны попадать в замеры.'
+    )
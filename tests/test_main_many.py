@@ -0,0 +1,64 @@
+from io import StringIO
+
+import pytest
+
+import homework
+from conftest import Capturing
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+] * 3
+
+
+def trainings():
+    return [homework.read_package(*package) for package in PACKAGES]
+
+
+def test_main_many_matches_main_on_stdout():
+    with Capturing() as expected:
+        for training in trainings():
+            homework.main(training)
+    with Capturing() as output:
+        assert homework.main_many(trainings()) == len(PACKAGES)
+    assert output == expected, (
+        'Вывод `main_many` должен построчно совпадать с `main`.'
+    )
+
+
+class CountingSink(StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+    def flush(self):
+        self.flushes += 1
+
+
+@pytest.mark.parametrize('batch_size, writes', [(1, 9), (4, 3), (100, 1)])
+def test_batched_writes(batch_size, writes):
+    sink = CountingSink()
+    homework.main_many(iter(trainings()), sink, batch_size=batch_size)
+    assert sink.writes == writes
+    assert sink.flushes == 1
+    assert len(sink.getvalue().splitlines()) == len(PACKAGES)
+
+
+def test_flush_control():
+    sink = CountingSink()
+    homework.main_many(trainings(), sink, flush=False)
+    assert sink.flushes == 0
+
+
+@pytest.mark.parametrize('batch_size', [0, -1])
+def test_batch_size_must_be_positive(batch_size):
+    sink = CountingSink()
+    with pytest.raises(ValueError):
+        homework.main_many(trainings(), sink, batch_size=batch_size)
+    assert sink.getvalue() == '', 'При ошибке ничего не должно записываться.'
@@ -0,0 +1,78 @@
+from io import StringIO
+
+import pytest
+
+import packets
+import pipeline
+
+
+@pytest.mark.parametrize('line, expected', [
+    (b'SWM,720,1,80,25,40\n', ('SWM', (720.0, 1.0, 80.0, 25.0, 40.0))),
+    (b'RUN,15000,1.5,75\r\n', ('RUN', (15000.0, 1.5, 75.0))),
+    (b'WLK,9000,1,75,180', ('WLK', (9000.0, 1.0, 75.0, 180.0))),
+    (b'  RUN,0,1,75  \n', ('RUN', (0.0, 1.0, 75.0))),
+    (b'SWM,720,1,80,25,0', ('SWM', (720.0, 1.0, 80.0, 25.0, 0.0))),
+])
+def test_valid_packets(line, expected):
+    assert list(packets.parse_packets([line])) == [expected]
+    assert packets.parse_line(line) == expected
+
+
+@pytest.mark.parametrize('line, reason', [
+    (b'XXX,1,1,1', packets.UNKNOWN_TYPE),
+    (b'RUN,15000,1', packets.ARITY),
+    (b'RUN', packets.ARITY),
+    (b'WLK,9000,1,75,180,1', packets.ARITY),
+    (b'RUN,15000,one,75', packets.NOT_A_NUMBER),
+    (b'RUN,15000,nan,75', packets.NOT_FINITE),
+    (b'RUN,1e999,1,75', packets.NOT_FINITE),
+    (b'RUN,15000,0,75', packets.OUT_OF_RANGE),
+    (b'WLK,9000,1,75,0', packets.OUT_OF_RANGE),
+    (b'SWM,720,1,80,0,40', packets.OUT_OF_RANGE),
+    (b'RUN,-1,1,75', packets.OUT_OF_RANGE),
+    (b'WLK,1e203,1,75,180', packets.OUT_OF_RANGE),
+    (b'RUN,15000,1e-320,75', packets.OUT_OF_RANGE),
+    (b'RUN,15000,1,1e300', packets.OUT_OF_RANGE),
+    (b'SWM,720,1,80,25,1e9', packets.OUT_OF_RANGE),
+])
+def test_rejected_packets(line, reason):
+    rejects = []
+    lines = [b'RUN,15000,1,75\n', line + b'\n', b'\n']
+    assert len(list(packets.parse_packets(lines, rejects.append))) == 1
+    assert rejects == [packets.Reject(2, line, reason, rejects[0].detail)], (
+        'Плохой пакет должен попасть в поток отклонённых с кодом причины.'
+    )
+    with pytest.raises(packets.PacketError):
+        list(packets.parse_packets(lines))
+
+
+def test_run_validated_matches_pipeline():
+    text = 'SWM,720,1,80,25,40\nRUN,15000,0,75\nWLK,9000,1,75,180\n'
+    output = StringIO()
+    rejects = StringIO()
+    lines = text.encode().splitlines(keepends=True)
+    assert pipeline.run_validated(lines, output, rejects) == 2
+    expected = StringIO()
+    pipeline.run_pipeline(StringIO(text.replace('RUN,15000,0,75\n', '')),
+                          expected)
+    assert output.getvalue() == expected.getvalue()
+    assert rejects.getvalue().split('\t')[:2] == ['2', packets.OUT_OF_RANGE]
+
+
+def test_range_bounds_are_inclusive():
+    low = packets.FIELD_RANGES['weight'][0]
+    high = packets.FIELD_RANGES['duration'][1]
+    line = f'RUN,0,{high!r},{low!r}'.encode()
+    assert list(packets.parse_packets([line])) == [
+        ('RUN', (0.0, high, low))
+    ], 'Значения на границах должны проходить проверку.'
+
+
+def test_run_validated_rejects_overflowing_packet():
+    lines = [b'WLK,1e203,1,75,180\n', b'RUN,15000,1,75\n']
+    output = StringIO()
+    rejects = StringIO()
+    assert pipeline.run_validated(lines, output, rejects) == 1, (
+        'Пакет, переполняющий расчёт, должен уйти в отклонённые.'
+    )
+    assert rejects.getvalue().split('\t')[:2] == ['1', packets.OUT_OF_RANGE]
@@ -0,0 +1,75 @@
+from io import StringIO
+
+import pytest
+
+import parallel
+import pipeline
+
+PACKETS = (
+    'SWM,720,1,80,25,40\n'
+    'RUN,15000,1,75\n'
+    'WLK,9000,1,75,180\n'
+) * 5
+
+
+@pytest.fixture
+def packets_file(tmp_path):
+    path = tmp_path / 'packets.txt'
+    path.write_text(PACKETS, encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('shard_size', [1, 5, 16, 19, 1 << 20])
+def test_shards_cover_every_line_once(packets_file, shard_size):
+    lines = []
+    for shard in parallel.split_shards(packets_file, shard_size):
+        lines.extend(parallel._shard_lines(*shard))
+    assert ''.join(lines) == PACKETS, (
+        'Каждая строка должна попасть ровно в один диапазон.'
+    )
+
+
+def test_run_parallel_keeps_input_order(packets_file):
+    expected = StringIO()
+    pipeline.run_pipeline(StringIO(PACKETS), expected)
+    output = StringIO()
+    written = parallel.run_parallel(
+        packets_file, output, workers=2, shard_size=23
+    )
+    assert written == 15
+    assert output.getvalue() == expected.getvalue()
+
+
+@pytest.mark.parametrize('workers', [1, 2, 4, 16])
+def test_default_shard_size_feeds_every_worker(workers):
+    size = 10_400_000
+    shard_size = parallel.shard_size_for(size, workers)
+    shards = -(-size // shard_size)
+    assert shards >= parallel.SHARDS_PER_WORKER * workers, (
+        'Каждому процессу должно достаться несколько диапазонов.'
+    )
+    assert parallel.MIN_SHARD_SIZE <= shard_size <= parallel.SHARD_SIZE
+
+
+def test_shard_size_for_small_and_large_files():
+    assert parallel.shard_size_for(0, 8) == parallel.MIN_SHARD_SIZE
+    assert parallel.shard_size_for(1 << 40, 8) == parallel.SHARD_SIZE
+
+
+def test_run_parallel_default_shard_size(packets_file):
+    output = StringIO()
+    assert parallel.run_parallel(packets_file, output, workers=2) == 15
+
+
+def test_bad_line_reports_file_line_number(tmp_path):
+    path = tmp_path / 'packets.txt'
+    path.write_text(PACKETS + 'RUN,1,0,75\n' + PACKETS, encoding='utf-8')
+    output = StringIO()
+    with pytest.raises(pipeline.LineError) as error:
+        parallel.run_parallel(str(path), output, workers=2, shard_size=40)
+    assert error.value.line_number == 16, (
+        'Номер строки должен считаться от начала файла.'
+    )
+    assert len(output.getvalue().splitlines()) == 15, (
+        'Сообщения строк до ошибки должны быть записаны.'
+    )
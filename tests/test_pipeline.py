@@ -0,0 +1,87 @@
+from io import StringIO
+
+import pytest
+
+import homework
+import pipeline
+
+PACKETS = (
+    'SWM,720,1,80,25,40\n'
+    'RUN,15000,1,75\n'
+    '\n'
+    'WLK,9000,1,75,180'
+)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 1 << 20])
+def test_read_lines_chunk_boundaries(chunk_size):
+    lines = list(pipeline.read_lines(StringIO(PACKETS), chunk_size))
+    assert lines == PACKETS.split('\n'), (
+        'Строки не должны теряться или склеиваться на границах блоков.'
+    )
+
+
+@pytest.mark.parametrize('batch_size', [1, 2, 4096])
+def test_run_pipeline_matches_main(batch_size):
+    expected = []
+    for line in PACKETS.split('\n'):
+        if line:
+            workout_type, *values = line.split(',')
+            training = homework.read_package(
+                workout_type, [float(value) for value in values]
+            )
+            expected.append(training.show_training_info().get_message())
+    output = StringIO()
+    written = pipeline.run_pipeline(
+        StringIO(PACKETS), output, chunk_size=5, batch_size=batch_size
+    )
+    assert written == 3
+    assert output.getvalue() == '\n'.join(expected) + '\n'
+
+
+def test_cli_files(tmp_path):
+    source = tmp_path / 'packets.txt'
+    source.write_text(PACKETS, encoding='utf-8')
+    destination = tmp_path / 'messages.txt'
+    assert pipeline.cli([str(source), '-o', str(destination)]) == 0
+    lines = destination.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == (
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.'
+    )
+    assert len(lines) == 3
+
+
+@pytest.mark.parametrize('option', ['--batch-size', '--chunk-size'])
+def test_cli_rejects_non_positive_sizes(tmp_path, option):
+    source = tmp_path / 'packets.txt'
+    source.write_text(PACKETS, encoding='utf-8')
+    with pytest.raises(SystemExit) as error:
+        pipeline.cli([str(source), '-o', str(tmp_path / 'out'), option, '0'])
+    assert error.value.code == 2, 'Нулевой размер должен давать ошибку.'
+
+
+@pytest.mark.parametrize('bad_line', ['RUN,1', 'RUN,15000,0,75', 'RUN,x,1,75'])
+def test_bad_line_keeps_computed_output(bad_line):
+    text = 'RUN,15000,1,75\n\nWLK,9000,1,75,180\n' + bad_line + '\nRUN,1,1,1\n'
+    output = StringIO()
+    with pytest.raises(pipeline.LineError) as error:
+        pipeline.run_pipeline(StringIO(text), output, batch_size=4096)
+    assert error.value.line_number == 4, 'Ошибка должна указывать номер строки.'
+    assert len(output.getvalue().splitlines()) == 2, (
+        'Сообщения строк до ошибки должны быть записаны.'
+    )
+
+
+def test_cli_reports_bad_line(tmp_path, capsys):
+    source = tmp_path / 'packets.txt'
+    source.write_text('RUN,15000,1,75\nRUN,1\n', encoding='utf-8')
+    destination = tmp_path / 'messages.txt'
+    assert pipeline.cli([str(source), '-o', str(destination)]) == 2
+    assert capsys.readouterr().err == (
+        'error: line 2: RUN expects 3 values, got 1\n'
+    )
+    assert len(destination.read_text(encoding='utf-8').splitlines()) == 1
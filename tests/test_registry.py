@@ -0,0 +1,58 @@
+import pytest
+
+import homework
+
+
+@pytest.fixture
+def cycling():
+    @homework.register('CYC')
+    class Cycling(homework.Training):
+        """Тренировка: велосипед."""
+        LEN_STEP: float = 5.5
+
+        def get_spent_calories(self) -> float:
+            return self.get_mean_speed() * self.weight
+
+    yield Cycling
+    del homework.TRAINING_TYPES['CYC']
+    del homework.TRAINING_FIELDS['CYC']
+    del homework._DISPATCH['CYC']
+
+
+def test_registered_types():
+    assert homework.TRAINING_TYPES == {
+        'SWM': homework.Swimming,
+        'RUN': homework.Running,
+        'WLK': homework.SportsWalking,
+    }
+
+
+def test_registered_fields(cycling):
+    assert homework.TRAINING_FIELDS['SWM'] == (
+        'action', 'duration', 'weight', 'length_pool', 'count_pool'
+    )
+    assert homework.TRAINING_FIELDS['CYC'] == (
+        'action', 'duration', 'weight'
+    ), 'Поля нового вида тренировки должны попасть в реестр.'
+
+
+def test_new_sport_without_dispatcher_change(cycling):
+    training = homework.read_package('CYC', (1000, 2, 70))
+    assert isinstance(training, cycling)
+    assert training.show_training_info().distance == 5.5
+
+
+def test_duplicate_code(cycling):
+    with pytest.raises(ValueError):
+        homework.register('CYC')(cycling)
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('RUN', [15000, 1]),
+    ('SWM', (720, 1, 80, 25)),
+    ('WLK', [9000, 1, 75, 180, 1]),
+    ('XXX', [1, 1, 1]),
+])
+def test_read_package_validates_packet(workout_type, data):
+    with pytest.raises(ValueError):
+        homework.read_package(workout_type, data)
@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+import server
+
+REQUESTS = [
+    'SWM,720,1,80,25,40',
+    'XXX,1,2,3',
+    'RUN,15000,1,75',
+    'RUN,1,0,75',
+    'WLK,9000,1,75,180',
+]
+
+
+async def exchange(lines, **options):
+    workout_server = server.WorkoutServer(**options)
+    await workout_server.start()
+    try:
+        reader, writer = await asyncio.open_connection(
+            '127.0.0.1', workout_server.port
+        )
+        writer.write(''.join(line + '\n' for line in lines).encode())
+        await writer.drain()
+        writer.write_eof()
+        responses = (await reader.read()).decode().splitlines()
+        writer.close()
+        return responses
+    finally:
+        await workout_server.close()
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'batch_size': 1, 'batch_window': 0},
+    {'batch_size': 2, 'queue_size': 1, 'connection_window': 1},
+])
+def test_responses_keep_request_order(options):
+    responses = asyncio.run(exchange(REQUESTS, **options))
+    assert responses == [server.compute_line(line) for line in REQUESTS]
+    assert responses[0].startswith('Тип тренировки: Swimming;')
+    assert responses[1].startswith(server.ERROR_PREFIX)
+    assert responses[3].startswith(server.ERROR_PREFIX), (
+        'Нулевая длительность должна давать ошибку, а не рвать соединение.'
+    )
+
+
+def test_overflow_does_not_stop_server():
+    async def scenario():
+        workout_server = server.WorkoutServer()
+        await workout_server.start()
+        try:
+            responses = []
+            for lines in (['WLK,1e203,1,75,180', 'RUN,15000,1,75'],
+                          ['RUN,15000,1,75']):
+                reader, writer = await asyncio.open_connection(
+                    '127.0.0.1', workout_server.port
+                )
+                writer.write(''.join(line + '\n' for line in lines).encode())
+                writer.write_eof()
+                responses.append(await asyncio.wait_for(reader.read(), 5))
+                writer.close()
+            return responses, workout_server._batcher.done()
+        finally:
+            await workout_server.close()
+
+    (first, second), stopped = asyncio.run(scenario())
+    first = first.decode().splitlines()
+    assert first[0].startswith(server.ERROR_PREFIX), (
+        'Переполнение должно давать ошибку в ответе.'
+    )
+    assert first[1].startswith('Тип тренировки: Running;')
+    assert second.decode().startswith('Тип тренировки: Running;'), (
+        'Сервер должен отвечать другим соединениям после ошибки.'
+    )
+    assert not stopped, 'Обработчик пачек не должен завершаться.'
+
+
+def test_unexpected_error_fails_only_its_request(monkeypatch):
+    compute_line = server.compute_line
+
+    def broken(line):
+        if line == 'boom':
+            raise RuntimeError('boom')
+        return compute_line(line)
+
+    monkeypatch.setattr(server, 'compute_line', broken)
+    responses = asyncio.run(exchange(['boom', 'RUN,15000,1,75']))
+    assert responses[0].startswith(server.ERROR_PREFIX)
+    assert responses[1].startswith('Тип тренировки: Running;')
+
+
+@pytest.mark.parametrize('options', [
+    {'queue_size': 0}, {'connection_window': 0}, {'batch_size': 0},
+    {'batch_window': -1},
+])
+def test_bad_limits(options):
+    with pytest.raises(ValueError):
+        server.WorkoutServer(**options)
+
+
+@pytest.mark.parametrize('option', [
+    '--queue-size', '--connection-window', '--batch-size',
+])
+def test_cli_rejects_unbounded_queues(option):
+    with pytest.raises(SystemExit) as error:
+        server.cli([option, '0'])
+    assert error.value.code == 2, (
+        'Нулевой предел очереди отключил бы обратное давление.'
+    )
@@ -0,0 +1,148 @@
+import math
+import pickle
+import random
+
+import pytest
+
+import homework
+import packets
+import sketches
+from workload import Workload
+
+
+def values(count, seed=0):
+    rnd = random.Random(seed)
+    return [
+        rnd.lognormvariate(3, 1.5) * rnd.choice([1, 1, 1, -1])
+        for _ in range(count)
+    ] + [0.0] * 10
+
+
+def exact_quantile(ordered, q):
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+@pytest.mark.parametrize('accuracy', [0.01, 0.05])
+def test_quantiles_within_relative_error(accuracy):
+    data = values(20000)
+    sketch = sketches.QuantileSketch(accuracy)
+    for value in data:
+        sketch.add(value)
+    ordered = sorted(data)
+    for q in [0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1]:
+        expected = exact_quantile(ordered, q)
+        assert abs(sketch.quantile(q) - expected) <= (
+            accuracy * abs(expected) + 1e-12
+        ), f'Квантиль {q} должен быть в пределах относительной ошибки.'
+
+
+def test_quantile_merge_matches_single_stream():
+    data = values(6000, seed=1)
+    single = sketches.QuantileSketch()
+    parts = [sketches.QuantileSketch() for _ in range(3)]
+    for number, value in enumerate(data):
+        single.add(value)
+        parts[number % 3].add(value)
+    merged = pickle.loads(pickle.dumps(parts[0]))
+    for part in parts[1:]:
+        merged.merge(pickle.loads(pickle.dumps(part)))
+    assert merged.count == single.count
+    for q in [0.1, 0.5, 0.9]:
+        assert merged.quantile(q) == single.quantile(q), (
+            'Слияние скетчей должно давать тот же результат, что один поток.'
+        )
+
+
+def test_bucket_limit_keeps_upper_quantiles():
+    sketch = sketches.QuantileSketch(0.01, max_buckets=64)
+    data = [math.exp(power / 10) for power in range(-300, 300)]
+    for value in data:
+        sketch.add(value)
+    assert sketch.buckets <= 64, 'Число корзин не должно превышать предел.'
+    ordered = sorted(data)
+    for q in [0.95, 0.99]:
+        expected = exact_quantile(ordered, q)
+        assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+
+
+def test_quantile_errors():
+    sketch = sketches.QuantileSketch()
+    with pytest.raises(ValueError):
+        sketch.quantile(0.5)
+    with pytest.raises(ValueError):
+        sketch.add(math.nan)
+    with pytest.raises(ValueError):
+        sketch.merge(sketches.QuantileSketch(0.05))
+
+
+def test_histogram():
+    histogram = sketches.Histogram.linear(0, 10, 5)
+    for value in [-1, 0, 1.9, 2, 9.99, 10, 42]:
+        histogram.add(value)
+    assert histogram.counts == [1, 2, 1, 0, 0, 1, 2]
+    other = sketches.Histogram(histogram.edges)
+    other.add(5)
+    histogram.merge(other)
+    assert histogram.count == 8
+    assert histogram.buckets()[3] == (4.0, 6.0, 1)
+    with pytest.raises(ValueError):
+        histogram.merge(sketches.Histogram([0, 1]))
+    with pytest.raises(ValueError):
+        sketches.Histogram([1, 1])
+
+
+@pytest.mark.parametrize('distinct', [10, 1000, 100_000])
+def test_hyperloglog_error(distinct):
+    counter = sketches.HyperLogLog(12)
+    for item in range(distinct):
+        counter.add(f'user-{item}')
+        counter.add(f'user-{item}')
+    error = 3 * 1.04 / math.sqrt(1 << 12)
+    assert counter.estimate() == pytest.approx(distinct, rel=error), (
+        'Оценка числа пользователей должна укладываться в 3 стандартные '
+        'ошибки.'
+    )
+
+
+def test_hyperloglog_merge_is_union():
+    first, second, union = (sketches.HyperLogLog(10) for _ in range(3))
+    for item in range(3000):
+        (first if item % 2 else second).add(item)
+        union.add(item)
+    first.merge(second)
+    assert first.registers == union.registers
+    with pytest.raises(ValueError):
+        first.merge(sketches.HyperLogLog(11))
+
+
+def test_workout_stats_merge_across_processes():
+    lines = [line.encode() for line in Workload(seed=5).records(3000)]
+    messages = list(packets.compute(packets.parse_packets(lines)))
+    users = [number % 250 for number in range(len(messages))]
+    single = sketches.WorkoutStats()
+    single.update(messages, users)
+    parts = []
+    for start in range(0, len(messages), 1000):
+        part = sketches.WorkoutStats()
+        part.update(messages[start:start + 1000], users[start:start + 1000])
+        parts.append(pickle.dumps(part))
+    merged = sketches.WorkoutStats()
+    for part in parts:
+        merged.merge(pickle.loads(part))
+    assert merged.summary() == single.summary()
+    summary = single.summary()
+    assert set(summary) == {'Running', 'SportsWalking', 'Swimming'}
+    assert sum(item['count'] for item in summary.values()) == len(messages)
+    assert summary['Running']['users'] == pytest.approx(250, rel=0.05)
+    assert single['Running'].speed_histogram.count == (
+        summary['Running']['count']
+    )
+
+
+def test_negative_calories():
+    stats = sketches.WorkoutStats()
+    info = homework.read_package('RUN', [1206, 12, 6]).show_training_info()
+    stats.add(info)
+    calories = stats.summary()['Running']['calories_p50']
+    assert calories == pytest.approx(info.calories, rel=0.01)
+    assert calories < 0
@@ -0,0 +1,66 @@
+import pytest
+
+import homework
+import store
+
+PACKAGES = [
+    ('SWM', [720, 1, 80, 25, 40]),
+    ('RUN', [15000, 1, 75]),
+    ('WLK', [9000, 1, 75, 180]),
+    ('RUN', [1206, 12, 6]),
+]
+
+
+def test_views_match_training_objects():
+    training_store = store.TrainingStore()
+    training_store.extend(PACKAGES)
+    assert len(training_store) == len(PACKAGES)
+    for view, (workout_type, data) in zip(training_store, PACKAGES):
+        training = homework.read_package(workout_type, data)
+        assert isinstance(view, type(training))
+        assert (
+            view.show_training_info().get_message()
+            == training.show_training_info().get_message()
+        ), 'Представление должно считать так же, как объект тренировки.'
+
+
+def test_views_by_type_and_count():
+    training_store = store.TrainingStore()
+    training_store.extend(PACKAGES)
+    assert training_store.count('RUN') == 2
+    assert [view.action for view in training_store.views('RUN')] == [
+        15000, 1206
+    ]
+    assert training_store[-1].duration == 12
+
+
+def test_nbytes():
+    training_store = store.TrainingStore()
+    training_store.extend(PACKAGES)
+    assert training_store.nbytes == (5 + 3 + 4 + 3) * 8 + 4 * 5
+
+
+@pytest.mark.parametrize('workout_type, data', [
+    ('XXX', [1, 1, 1]),
+    ('RUN', [1, 1]),
+])
+def test_append_rejects_bad_packets(workout_type, data):
+    training_store = store.TrainingStore()
+    with pytest.raises(ValueError):
+        training_store.append(workout_type, data)
+    assert len(training_store) == 0
+
+
+@pytest.mark.parametrize('bad_value, error', [
+    ('x', ValueError), (None, TypeError),
+])
+def test_bad_value_leaves_store_consistent(bad_value, error):
+    training_store = store.TrainingStore()
+    with pytest.raises(error):
+        training_store.append('RUN', [15000, bad_value, 75])
+    assert training_store.count('RUN') == 0, (
+        'Ошибочный пакет не должен оставлять частичную запись.'
+    )
+    training_store.append('RUN', [15000, 1, 75])
+    assert training_store[0].duration == 1.0
+    assert training_store[0].weight == 75.0
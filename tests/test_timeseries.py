@@ -0,0 +1,88 @@
+import pytest
+
+import homework
+
+np = pytest.importorskip('numpy')
+timeseries = pytest.importorskip('timeseries')
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def collapsed(series, **params):
+    actions = np.cumsum(series.actions)[-1]
+    hours = np.cumsum(series.seconds)[-1] / timeseries.SECONDS_IN_HOUR
+    return homework.read_package(
+        series.workout_type, [actions, hours, *params.values()]
+    ).show_training_info()
+
+
+@pytest.mark.parametrize('workout_type, params', [
+    ('RUN', {'weight': 75}),
+    ('WLK', {'weight': 75, 'height': 180}),
+])
+def test_total_matches_read_package(rng, workout_type, params):
+    series = timeseries.TimeSeries(
+        workout_type, rng.integers(0, 4, 3600), rng.uniform(0.5, 1.5, 3600),
+        **params,
+    )
+    assert series.total() == collapsed(series, **params), (
+        'Итог по замерам должен совпадать с расчётом по суммам до бита.'
+    )
+
+
+def test_swimming_counts_pools_per_interval(rng):
+    pools = np.arange(1800) % 40 == 39
+    series = timeseries.TimeSeries(
+        'SWM', rng.integers(0, 2, 1800), weight=80, length_pool=25,
+        count_pool=pools,
+    )
+    expected = collapsed(
+        series, weight=80, length_pool=25, count_pool=int(pools.sum())
+    )
+    assert series.total() == expected
+    laps = series.laps(np.flatnonzero(pools) + 1)
+    assert len(laps) == pools.sum()
+    assert {lap.speed for lap in laps} == {25 / 1000 / (40 / 3600)}
+
+
+def test_intervals_and_laps_add_up(rng):
+    series = timeseries.TimeSeries(
+        'WLK', rng.integers(0, 3, 1200), weight=70, height=175
+    )
+    total = series.total()
+    distance, speed, calories = series.intervals()
+    assert len(distance) == len(series)
+    assert np.allclose(distance / (1 / 3600), speed)
+    assert calories.sum() == pytest.approx(total.calories)
+    laps = series.laps([300, 600, 900])
+    assert len(laps) == 4
+    assert sum(lap.calories for lap in laps) == pytest.approx(total.calories)
+    assert sum(lap.distance for lap in laps) == pytest.approx(total.distance)
+    assert sum(lap.duration for lap in laps) == pytest.approx(total.duration)
+
+
+def test_splits(rng):
+    series = timeseries.TimeSeries('RUN', rng.integers(0, 4, 3600), weight=75)
+    splits = series.splits(1.0)
+    covered = series.total().distance
+    assert len(splits) == int(covered) + 1
+    boundaries = np.cumsum([split.distance for split in splits[:-1]])
+    assert (boundaries >= np.arange(1, len(splits)) - 1e-9).all(), (
+        'Отрезок k должен заканчиваться, когда пройдено k км.'
+    )
+    assert sum(split.distance for split in splits) == pytest.approx(covered)
+
+
+@pytest.mark.parametrize('args, params, error', [
+    (('XXX', [1]), {'weight': 1}, ValueError),
+    (('RUN', [1]), {}, TypeError),
+    (('RUN', [1]), {'weight': 1, 'height': 1}, TypeError),
+    (('RUN', []), {'weight': 1}, ValueError),
+    (('RUN', [1, 2], [1, 0]), {'weight': 1}, ValueError),
+])
+def test_bad_arguments(args, params, error):
+    with pytest.raises(error):
+        timeseries.TimeSeries(*args, **params)
@@ -0,0 +1,108 @@
+from collections import Counter
+from io import BytesIO
+
+import pytest
+
+import homework
+import packets
+import workload
+
+
+def test_same_seed_same_stream():
+    first = list(workload.Workload(seed=7, malformed=0.1).records(500))
+    second = list(workload.Workload(seed=7, malformed=0.1).records(500))
+    other = list(workload.Workload(seed=8, malformed=0.1).records(500))
+    assert first == second, 'Один seed должен давать один и тот же поток.'
+    assert first != other
+
+
+def test_valid_records_pass_validation():
+    lines = [
+        line.encode() for line in workload.Workload(seed=1).records(3000)
+    ]
+    rejects = []
+    parsed = list(packets.parse_packets(lines, rejects.append))
+    assert not rejects, 'Без порчи все строки должны проходить проверку.'
+    assert len(parsed) == len(lines)
+
+
+def test_mix_and_ranges():
+    generator = workload.Workload(
+        seed=2, mix={'RUN': 3, 'SWM': 1},
+        ranges={'RUN': {'duration': (1.0, 1.0)}},
+    )
+    lines = list(generator.records(4000))
+    types = Counter(line.split(',')[0] for line in lines)
+    assert set(types) == {'RUN', 'SWM'}
+    assert 2.5 < types['RUN'] / types['SWM'] < 3.5, (
+        'Доли видов тренировок должны следовать весам mix.'
+    )
+    assert {
+        line.split(',')[2] for line in lines if line.startswith('RUN')
+    } == {'1.000'}
+
+
+def test_malformed_share_and_reasons():
+    lines = [
+        line.encode()
+        for line in workload.Workload(seed=3, malformed=0.2).records(5000)
+    ]
+    rejects = []
+    list(packets.parse_packets(lines, rejects.append))
+    assert 800 < len(rejects) < 1200, (
+        'Доля испорченных строк должна соответствовать malformed.'
+    )
+    assert {reject.reason for reject in rejects} == set(workload.MALFORMED)
+
+
+@pytest.mark.parametrize('count, pool_size', [(100, 1000), (2500, 1000)])
+def test_chunks(count, pool_size):
+    generator = workload.Workload(seed=4)
+    data = b''.join(generator.chunks(count, pool_size, chunk_records=300))
+    lines = data.decode().splitlines(True)
+    assert len(lines) == count
+    expected = list(generator.records(min(count, pool_size)))
+    assert lines[:pool_size] == expected, (
+        'Первые pool_size строк должны совпадать с records().'
+    )
+    assert set(lines) == set(expected)
+    assert data == b''.join(generator.chunks(count, pool_size, 300))
+
+
+@pytest.mark.parametrize('pool_size', [0, 64])
+def test_write(pool_size):
+    stream = BytesIO()
+    written = workload.Workload(seed=5).write(stream, 1000, pool_size)
+    assert written == len(stream.getvalue())
+    assert stream.getvalue().count(b'\n') == 1000
+
+
+def test_packages_follow_records():
+    generator = workload.Workload(seed=6)
+    packages = list(generator.packages(500))
+    assert [
+        ','.join([workout_type, *map(str, data)])
+        for workout_type, data in packages
+    ] == [
+        ','.join([code, *map(str, map(float, values))])
+        for code, *values in (
+            line.rstrip('\n').split(',') for line in generator.records(500)
+        )
+    ], 'Пакеты должны повторять строки records().'
+    assert all(
+        len(data) == len(homework.TRAINING_FIELDS[workout_type])
+        for workout_type, data in packages
+    )
+    with pytest.raises(ValueError):
+        next(workload.Workload(malformed=0.1).packages(1))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'mix': {'XXX': 1}},
+    {'mix': {'RUN': 0}},
+    {'malformed': 1.5},
+    {'kinds': ['BROKEN']},
+])
+def test_bad_parameters(kwargs):
+    with pytest.raises(ValueError):
+        workload.Workload(**kwargs)
@@ -0,0 +1,158 @@
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from batch import BATCH_KERNELS, FIELDS, Columns
+from homework import TRAINING_FIELDS, TRAINING_TYPES, InfoMessage
+
+SECONDS_IN_HOUR: int = 3600
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+class TimeSeries:
+    """Тренировка по замерам за интервалы, а не по одному итогу.
+
+    `actions` — шаги или гребки за каждый интервал, `seconds` — длина
+    интервалов (число или массив). Остальные параметры — поля класса
+    тренировки (`weight`, `height`, `length_pool`, `count_pool`);
+    `count_pool` для плавания — бассейны, проплытые за каждый интервал.
+    Все расчёты векторные, объекты Training по замерам не создаются.
+
+    Итог совпадает до бита с `read_package` на суммах замеров.
+    Калории интервала и отрезка — прирост калорий накопленного итога,
+    поэтому они складываются в общий итог для любого вида тренировки,
+    хотя формулы ходьбы и плавания не аддитивны.
+    """
+
+    def __init__(
+            self,
+            workout_type: str,
+            actions: ArrayLike,
+            seconds: ArrayLike = 1.0,
+            **params: ArrayLike,
+    ) -> None:
+        if workout_type not in BATCH_KERNELS:
+            raise ValueError(f'This key is not found: {workout_type}')
+        fields = TRAINING_FIELDS[workout_type][2:]
+        missing = sorted(set(fields) - set(params))
+        unexpected = sorted(set(params) - set(fields))
+        if missing or unexpected:
+            raise TypeError(
+                f'{workout_type} needs parameters {list(fields)}, '
+                f'missing {missing}, unexpected {unexpected}'
+            )
+        self.workout_type = workout_type
+        self.training_type = TRAINING_TYPES[workout_type].__name__
+        self.actions = np.asarray(actions, dtype=np.float64)
+        if self.actions.ndim != 1 or not len(self.actions):
+            raise ValueError('Actions must be a non-empty 1-D array')
+        size = len(self.actions)
+        self.seconds = np.broadcast_to(
+            np.asarray(seconds, dtype=np.float64), (size,)
+        )
+        if not (self.seconds > 0).all():
+            raise ValueError('Interval lengths must be positive')
+        self.params: Dict[str, np.ndarray] = {
+            name: np.broadcast_to(np.asarray(value, dtype=np.float64), (size,))
+            for name, value in params.items()
+        }
+        self._kernel = BATCH_KERNELS[workout_type]
+        self._elapsed = np.cumsum(self.seconds)
+        self._cumulative = self._columns(
+            np.cumsum(self.actions), self._elapsed,
+            np.cumsum(self._count_pool()),
+        )
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def _count_pool(self) -> np.ndarray:
+        return self.params.get('count_pool', np.zeros(len(self)))
+
+    def _columns(
+            self,
+            actions: np.ndarray,
+            seconds: np.ndarray,
+            count_pools: np.ndarray,
+            index: Union[slice, np.ndarray] = slice(None),
+    ) -> Columns:
+        """Посчитать формулы вида тренировки по колонкам интервалов."""
+
+        columns = {
+            'action': actions,
+            'duration': seconds / SECONDS_IN_HOUR,
+            'count_pool': count_pools,
+        }
+        for name in FIELDS:
+            if name not in columns:
+                columns[name] = self.params.get(
+                    name, np.zeros(len(self))
+                )[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self._kernel(*(columns[name] for name in FIELDS))
+
+    def cumulative(self) -> Columns:
+        """Дистанция, скорость и калории накопленным итогом по интервалам."""
+
+        return self._cumulative
+
+    def intervals(self) -> Columns:
+        """Дистанция, скорость и калории каждого интервала."""
+
+        distance, speed, _ = self._columns(
+            self.actions, self.seconds, self._count_pool()
+        )
+        calories = np.diff(self._cumulative[2], prepend=0.0)
+        return distance, speed, calories
+
+    def total(self) -> InfoMessage:
+        """Итог тренировки по всем интервалам."""
+
+        distance, speed, calories = self._cumulative
+        return InfoMessage(
+            self.training_type, float(self._elapsed[-1] / SECONDS_IN_HOUR),
+            float(distance[-1]), float(speed[-1]), float(calories[-1]),
+        )
+
+    def laps(self, starts: Sequence[int]) -> List[InfoMessage]:
+        """Итоги отрезков, начинающихся с интервалов `starts`.
+
+        Первый отрезок всегда начинается с нулевого интервала, начало
+        сразу после последнего интервала (`len(series)`) пропускается.
+        """
+
+        starts = np.union1d([0], np.asarray(starts, dtype=np.intp))
+        if starts[-1] > len(self) or starts[0] < 0:
+            raise ValueError(f'Lap starts out of range: {starts.tolist()}')
+        starts = starts[starts < len(self)]
+        seconds = np.add.reduceat(self.seconds, starts)
+        distance, speed, _ = self._columns(
+            np.add.reduceat(self.actions, starts), seconds,
+            np.add.reduceat(self._count_pool(), starts), starts,
+        )
+        ends = np.append(starts[1:], len(self)) - 1
+        cumulative = self._cumulative[2][ends]
+        calories = np.diff(cumulative, prepend=0.0)
+        return [
+            InfoMessage(self.training_type, *values)
+            for values in zip(
+                (seconds / SECONDS_IN_HOUR).tolist(), distance.tolist(),
+                speed.tolist(), calories.tolist(),
+            )
+        ]
+
+    def splits(self, distance: float) -> List[InfoMessage]:
+        """Итоги отрезков по `distance` км; последний может быть короче.
+
+        Отрезок заканчивается на интервале, где накопленная дистанция
+        достигает очередного кратного `distance`, без интерполяции
+        внутри интервала.
+        """
+
+        if distance <= 0:
+            raise ValueError(f'Split distance must be positive: {distance}')
+        covered = self._cumulative[0]
+        marks = np.arange(1, int(covered[-1] // distance) + 1) * distance
+        ends = np.searchsorted(covered, marks)
+        return self.laps(np.unique(ends[ends < len(self) - 1] + 1))
@@ -0,0 +1,276 @@
+import argparse
+import random
+import sys
+from bisect import bisect
+from itertools import accumulate, islice
+from typing import (IO, Callable, Dict, Iterator, List, Mapping, Optional,
+                    Sequence, Tuple)
+
+import homework
+import packets
+
+Range = Tuple[float, float]
+
+POOL_SIZE: int = 1 << 16
+CHUNK_RECORDS: int = 1 << 14
+INTEGER_FIELDS = frozenset({'action', 'height', 'length_pool', 'count_pool'})
+FLOAT_FORMATS: Dict[str, str] = {'duration': '.3f', 'weight': '.1f'}
+
+DEFAULT_MIX: Dict[str, float] = {'SWM': 1.0, 'RUN': 1.0, 'WLK': 1.0}
+DEFAULT_RANGES: Dict[str, Dict[str, Range]] = {
+    'SWM': {
+        'action': (300, 2500),
+        'duration': (0.3, 1.5),
+        'weight': (45.0, 110.0),
+        'length_pool': (25, 50),
+        'count_pool': (10, 80),
+    },
+    'RUN': {
+        'action': (3000, 20000),
+        'duration': (0.3, 2.0),
+        'weight': (50.0, 110.0),
+    },
+    'WLK': {
+        'action': (2000, 15000),
+        'duration': (0.3, 2.5),
+        'weight': (45.0, 120.0),
+        'height': (150, 200),
+    },
+}
+
+
+def _unknown_type(rng: random.Random, code: str, values: List[str]) -> str:
+    return ','.join(['XXX', *values])
+
+
+def _arity(rng: random.Random, code: str, values: List[str]) -> str:
+    return ','.join([code, *values[:-1]])
+
+
+def _not_a_number(rng: random.Random, code: str, values: List[str]) -> str:
+    values[rng.randrange(len(values))] = 'n/a'
+    return ','.join([code, *values])
+
+
+def _not_finite(rng: random.Random, code: str, values: List[str]) -> str:
+    values[rng.randrange(len(values))] = rng.choice(('nan', 'inf'))
+    return ','.join([code, *values])
+
+
+def _out_of_range(rng: random.Random, code: str, values: List[str]) -> str:
+    index = rng.randrange(len(values))
+    values[index] = '0' if index == 1 else '-' + values[index]
+    return ','.join([code, *values])
+
+
+MALFORMED: Dict[str, Callable[[random.Random, str, List[str]], str]] = {
+    packets.UNKNOWN_TYPE: _unknown_type,
+    packets.ARITY: _arity,
+    packets.NOT_A_NUMBER: _not_a_number,
+    packets.NOT_FINITE: _not_finite,
+    packets.OUT_OF_RANGE: _out_of_range,
+}
+
+
+class Workload:
+    """Воспроизводимый поток пакетов датчиков для нагрузочных тестов.
+
+    Вид тренировки выбирается с весами `mix`, значения полей — равномерно
+    в диапазонах `ranges` (по умолчанию DEFAULT_RANGES, переопределяются
+    по виду и полю). Доля `malformed` строк портится одним из способов
+    MALFORMED, ключ которого совпадает с кодом причины в `packets`.
+    Одинаковые параметры и `seed` дают одинаковый поток.
+    """
+
+    def __init__(
+            self,
+            seed: int = 0,
+            mix: Optional[Mapping[str, float]] = None,
+            ranges: Optional[Mapping[str, Mapping[str, Range]]] = None,
+            malformed: float = 0.0,
+            kinds: Optional[Sequence[str]] = None,
+    ) -> None:
+        mix = dict(DEFAULT_MIX if mix is None else mix)
+        if not mix or min(mix.values()) < 0 or sum(mix.values()) <= 0:
+            raise ValueError(f'Mix weights must be non-negative: {mix}')
+        for code in mix:
+            if code not in homework.TRAINING_TYPES:
+                raise ValueError(f'This key is not found: {code}')
+        if not 0.0 <= malformed <= 1.0:
+            raise ValueError(f'Malformed share must be in [0, 1]: {malformed}')
+        self.seed = seed
+        self.mix = mix
+        self.malformed = malformed
+        self.kinds = tuple(MALFORMED if kinds is None else kinds)
+        for kind in self.kinds:
+            if kind not in MALFORMED:
+                raise ValueError(f'Unknown malformed kind: {kind}')
+        self._fields: Dict[str, List[Tuple[str, Range]]] = {}
+        for code in mix:
+            bounds = dict(DEFAULT_RANGES.get(code, {}))
+            bounds.update((ranges or {}).get(code, {}))
+            names = homework.TRAINING_FIELDS[code]
+            missing = [name for name in names if name not in bounds]
+            if missing:
+                raise ValueError(f'{code} has no range for {missing}')
+            self._fields[code] = [(name, bounds[name]) for name in names]
+
+    def records(self, count: Optional[int] = None) -> Iterator[str]:
+        """Выдать `count` строк пакетов (бесконечно при None) с '\\n'."""
+
+        rng = random.Random(self.seed)
+        codes = list(self.mix)
+        cum_weights = list(accumulate(self.mix[code] for code in codes))
+        total = cum_weights[-1]
+        last = len(codes) - 1
+        fields = [
+            [
+                (name in INTEGER_FIELDS, low, high,
+                 FLOAT_FORMATS.get(name, 'g'))
+                for name, (low, high) in self._fields[code]
+            ]
+            for code in codes
+        ]
+        malformed = self.malformed if self.kinds else 0.0
+        kinds = [MALFORMED[kind] for kind in self.kinds]
+        randint = rng.randint
+        uniform = rng.uniform
+        rand = rng.random
+        produced = 0
+        while count is None or produced < count:
+            index = bisect(cum_weights, rand() * total, 0, last)
+            values = [
+                str(randint(low, high)) if is_integer
+                else format(uniform(low, high), spec)
+                for is_integer, low, high, spec in fields[index]
+            ]
+            if malformed and rand() < malformed:
+                line = rng.choice(kinds)(rng, codes[index], values)
+            else:
+                line = ','.join([codes[index], *values])
+            produced += 1
+            yield line + '\n'
+
+    def packages(
+            self, count: Optional[int] = None
+    ) -> Iterator[Tuple[str, List[float]]]:
+        """Выдать строки `records()` разобранными пакетами (вид, данные)."""
+
+        if self.malformed:
+            raise ValueError('Packages are built only from valid records')
+        for line in self.records(count):
+            workout_type, *values = line.split(',')
+            yield workout_type, [float(value) for value in values]
+
+    def chunks(
+            self,
+            count: int,
+            pool_size: int = POOL_SIZE,
+            chunk_records: int = CHUNK_RECORDS,
+    ) -> Iterator[bytes]:
+        """Выдать `count` строк блоками байтов на скорости копирования памяти.
+
+        Первые `pool_size` строк совпадают с `records()`, дальше тот же
+        набор повторяется, каждый раз с другой точки, выбранной по `seed`.
+        Распределение остаётся прежним, но уникальных строк — не больше
+        `pool_size`.
+        """
+
+        pool = [line.encode('ascii') for line in self.records(
+            min(count, pool_size)
+        )]
+        if not pool:
+            return
+        offsets = [0]
+        for line in pool:
+            offsets.append(offsets[-1] + len(line))
+        blob = b''.join(pool)
+        size = len(pool)
+        rng = random.Random(self.seed)
+        rotation = position = 0
+        remaining = count
+        while remaining:
+            taken = min(remaining, chunk_records, size - position)
+            begin = (rotation + position) % size
+            end = begin + taken
+            if end <= size:
+                yield blob[offsets[begin]:offsets[end]]
+            else:
+                yield blob[offsets[begin]:] + blob[:offsets[end - size]]
+            remaining -= taken
+            position += taken
+            if position == size:
+                rotation = rng.randrange(size)
+                position = 0
+
+    def write(
+            self,
+            stream: IO[bytes],
+            count: int,
+            pool_size: int = POOL_SIZE,
+    ) -> int:
+        """Записать `count` строк в двоичный поток, вернуть число байт."""
+
+        written = 0
+        if pool_size:
+            for chunk in self.chunks(count, pool_size):
+                written += stream.write(chunk)
+            return written
+        lines = self.records(count)
+        while True:
+            block = ''.join(islice(lines, CHUNK_RECORDS))
+            if not block:
+                return written
+            written += stream.write(block.encode('ascii'))
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Разобрать смесь видов тренировок вида `SWM=1,RUN=2`."""
+
+    mix = {}
+    for item in text.split(','):
+        code, _, weight = item.partition('=')
+        mix[code.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def cli(argv: Optional[Sequence[str]] = None) -> int:
+    """Точка входа командной строки."""
+
+    parser = argparse.ArgumentParser(
+        description='Сгенерировать воспроизводимый поток пакетов датчиков.',
+    )
+    parser.add_argument('count', type=int, help='число строк')
+    parser.add_argument(
+        '-o', '--output', default='-',
+        help='файл для пакетов, `-` — стандартный вывод',
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--mix', type=parse_mix, default=DEFAULT_MIX,
+        help='веса видов тренировок, например SWM=1,RUN=2,WLK=1',
+    )
+    parser.add_argument(
+        '--malformed', type=float, default=0.0,
+        help='доля испорченных строк от 0 до 1',
+    )
+    parser.add_argument(
+        '--pool-size', type=int, default=POOL_SIZE,
+        help='число уникальных строк, 0 — все строки уникальны',
+    )
+    args = parser.parse_args(argv)
+    try:
+        workload = Workload(args.seed, args.mix, malformed=args.malformed)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.output == '-':
+        workload.write(sys.stdout.buffer, args.count, args.pool_size)
+        sys.stdout.flush()
+    else:
+        with open(args.output, 'wb') as stream:
+            workload.write(stream, args.count, args.pool_size)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(cli())